@@ -2,20 +2,173 @@ import sqlite3
 import json
 import time
 import traceback
+import zlib
+import queue
+import threading
+import atexit
+import asyncio
+import contextvars
 from datetime import datetime
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Any, Dict, Optional, List, Callable
 import streamlit as st
 import os
 
+# Prefer orjson for parameters/result_data, falling back to the stdlib codec
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Longest stack trace stored per audit entry; older frames are dropped first
+MAX_STACK_TRACE_CHARS = 8192
+# Stack traces longer than this many bytes are stored zlib-compressed in stack_trace_blob
+STACK_TRACE_COMPRESS_MIN = 256
+
+class _LazyTrace:
+    """Stack trace that is only formatted when the writer thread stores it."""
+    
+    __slots__ = ('exc_info',)
+    
+    def __init__(self, error: BaseException):
+        self.exc_info = (type(error), error, error.__traceback__)
+    
+    def __str__(self) -> str:
+        text = ''.join(traceback.format_exception(*self.exc_info))
+        if len(text) > MAX_STACK_TRACE_CHARS:
+            text = '... (truncated)\n' + text[-MAX_STACK_TRACE_CHARS:]
+        return text
+    
+    def to_db(self):
+        """Format for storage, compressing long traces.
+        
+        Text is stored in the stack_trace column and compressed bytes in stack_trace_blob.
+        """
+        text = str(self)
+        data = text.encode('utf-8')
+        if len(data) > STACK_TRACE_COMPRESS_MIN:
+            return zlib.compress(data)
+        return text
+
+# Lets the writer thread bind _LazyTrace values directly in INSERT parameters
+sqlite3.register_adapter(_LazyTrace, _LazyTrace.to_db)
+
+# (user_id, customer_id, session_id) pinned by AuditLogger.identity_context() for work
+# running off the Streamlit script thread, which cannot see the session's state
+_pinned_identity: contextvars.ContextVar = contextvars.ContextVar('audit_identity', default=None)
+
+def _extract_error_details(error: Exception) -> tuple:
+    """Get (error_message, error_code, error_type) for an exception."""
+    error_type = type(error).__name__
+    error_code = None
+    error_message = str(error)
+    
+    # Try to extract Google Ads API specific error details
+    if hasattr(error, 'failure') and hasattr(error.failure, 'errors'):
+        # Google Ads API exception
+        errors = []
+        for err in error.failure.errors:
+            error_info = {
+                'error_code': getattr(err, 'error_code', {}).get('name', 'UNKNOWN'),
+                'message': getattr(err, 'message', str(err)),
+                'location': getattr(err, 'location', None)
+            }
+            errors.append(error_info)
+            if error_code is None:  # Use the first error code
+                error_code = error_info['error_code']
+        
+        error_message = f"Google Ads API Error: {json.dumps(errors)}"
+    elif hasattr(error, 'code'):
+        # HTTP or other errors with codes
+        error_code = str(error.code)
+    
+    return error_message, error_code, error_type
+
 class AuditLogger:
+    # Maximum number of queued rows written in a single transaction
+    BATCH_SIZE = 500
+    # Longest time (seconds) the writer waits for a batch to fill before committing
+    BATCH_MAX_WAIT = 0.1
+    # Most rows allowed to wait for the writer; further entries are dropped
+    QUEUE_MAX_SIZE = 10_000
+    
+    # Optional get_audit_logs filters, in argument order, with their WHERE clauses
+    _LOG_FILTER_CLAUSES = (
+        "user_id = ?",
+        "customer_id = ?",
+        "operation_type = ?",
+        "resource_type = ?",
+        "timestamp >= ?",
+        "timestamp <= ?",
+    )
+    
+    # Rows carry one stack trace value (?13); its type decides which column it goes to
+    _INSERT_SQL = '''
+        INSERT INTO audit_logs (
+            user_id, customer_id, operation_type, resource_type,
+            resource_id, function_name, parameters, result_status,
+            result_data, error_message, error_type, error_code,
+            stack_trace, stack_trace_blob, execution_time_ms, session_id, ts_epoch
+        ) VALUES (
+            ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12,
+            CASE WHEN typeof(?13) = 'blob' THEN NULL ELSE ?13 END,
+            CASE WHEN typeof(?13) = 'blob' THEN ?13 END,
+            ?14, ?15, ?16
+        )
+    '''
+    
     def __init__(self, db_path: str = "audit_log.db"):
         self.db_path = db_path
-        self.init_database()
+        # When False, nothing is logged; AUDIT_DISABLED=1 starts the logger switched off
+        self.enabled = os.getenv('AUDIT_DISABLED') != '1'
+        # One long-lived connection per thread, opened lazily by _get_conn()
+        self._local = threading.local()
+        
+        # Rows are written by a background thread so callers never wait on disk
+        self._queue = queue.Queue(maxsize=self.QUEUE_MAX_SIZE)
+        # Entries discarded because the writer had fallen too far behind or could not store them;
+        # caller threads and the writer both add to it, so updates go through _count_dropped()
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._writer = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.flush)
+        
+        # A disabled logger creates the database and writer only once it is used
+        if self.enabled:
+            self._start()
+    
+    def _start(self):
+        """Create the database and start the writer thread, if not done yet."""
+        with self._start_lock:
+            if self._writer is None:
+                self.init_database()
+                self._writer = threading.Thread(target=self._writer_loop, name="audit-log-writer", daemon=True)
+                self._writer.start()
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening and tuning it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # A larger statement cache keeps _INSERT_SQL and the dashboard queries prepared
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False,
+                                   cached_statements=256)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-20000')
+            self._local.conn = conn
+        return conn
     
     def init_database(self):
         """Initialize the audit log database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         # Create audit_logs table
@@ -29,15 +182,17 @@ class AuditLogger:
                 resource_type TEXT NOT NULL,
                 resource_id TEXT,
                 function_name TEXT NOT NULL,
-                parameters TEXT,
+                parameters BLOB,
                 result_status TEXT,
-                result_data TEXT,
+                result_data BLOB,
                 error_message TEXT,
                 error_type TEXT,
                 error_code TEXT,
                 stack_trace TEXT,
                 execution_time_ms INTEGER,
-                session_id TEXT
+                session_id TEXT,
+                ts_epoch INTEGER,
+                stack_trace_blob BLOB
             )
         ''')
         
@@ -57,15 +212,47 @@ class AuditLogger:
         except sqlite3.OperationalError:
             pass  # Column already exists
         
+        try:
+            cursor.execute('ALTER TABLE audit_logs ADD COLUMN ts_epoch INTEGER')
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        try:
+            cursor.execute('ALTER TABLE audit_logs ADD COLUMN stack_trace_blob BLOB')
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Move compressed traces that earlier versions stored in the TEXT column
+        cursor.execute("UPDATE audit_logs SET stack_trace_blob = stack_trace, stack_trace = NULL WHERE typeof(stack_trace) = 'blob'")
+        
         # Create indexes for better performance
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON audit_logs(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_id ON audit_logs(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_id ON audit_logs(customer_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_operation_type ON audit_logs(operation_type)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_resource_type ON audit_logs(resource_type)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ts_epoch ON audit_logs(ts_epoch)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_status_epoch ON audit_logs(result_status, ts_epoch)')
+        # Replaced by idx_status_epoch; drop it from older databases so inserts stop maintaining it
+        cursor.execute('DROP INDEX IF EXISTS idx_status_ts')
         
-        conn.commit()
-        conn.close()
+        # Monthly archive files created by archive_old_logs()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS audit_log_archives (
+                month TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                min_ts_epoch INTEGER,
+                max_ts_epoch INTEGER,
+                row_count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Backfill the epoch column for rows written before it existed
+        cursor.execute("UPDATE audit_logs SET ts_epoch = CAST(strftime('%s', timestamp) AS INTEGER) WHERE ts_epoch IS NULL")
+        
+        # Partial indexes covering the error breakdowns on the dashboard
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_err_type ON audit_logs(error_type) WHERE result_status = 'ERROR'")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_err_code ON audit_logs(error_code) WHERE result_status = 'ERROR'")
     
     def get_user_id(self) -> str:
         """Get current user ID from Streamlit session state or environment."""
@@ -89,6 +276,45 @@ class AuditLogger:
             st.session_state.session_id = f"session_{int(time.time())}"
         return st.session_state.session_id
     
+    def _identity(self) -> tuple:
+        """Get (user_id, customer_id, session_id), resolved once per session.
+        
+        Re-resolved when the session's customer ID changes. An identity pinned with
+        identity_context() takes precedence.
+        """
+        pinned = _pinned_identity.get()
+        if pinned is not None:
+            return pinned
+        
+        customer_id = st.session_state.get('customer_id', 'unknown')
+        identity = st.session_state.get('__audit_identity__')
+        if identity is None or identity[1] != customer_id:
+            identity = (self.get_user_id(), customer_id, self.get_session_id())
+            st.session_state['__audit_identity__'] = identity
+        return identity
+    
+    def reset_identity(self):
+        """Forget the cached identity, e.g. after the user ID is changed."""
+        st.session_state.pop('__audit_identity__', None)
+    
+    def identity_context(self) -> contextvars.Context:
+        """Copy the current context with the caller's identity pinned in it.
+        
+        Worker threads have no Streamlit script context, so st.session_state there is an
+        empty throwaway and their entries would be logged for an unknown customer. Call
+        this on the calling thread and run the work with identity_context().run(func, ...)
+        to log it under the caller's identity. A context can only be entered by one thread
+        at a time, so take a new one for every task.
+        """
+        context = contextvars.copy_context()
+        if not self.enabled:
+            return context
+        try:
+            context.run(_pinned_identity.set, self._identity())
+        except Exception as e:
+            print(f"Error resolving audit identity: {e}")
+        return context
+    
     def log_operation(self, 
                      operation_type: str,
                      resource_type: str,
@@ -100,44 +326,127 @@ class AuditLogger:
                      error_message: str = None,
                      error_type: str = None,
                      error_code: str = None,
-                     stack_trace: str = None,
+                     stack_trace: Any = None,
                      execution_time_ms: int = None):
-        """Log an operation to the audit database."""
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Queue an operation for writing to the audit database."""
+        if not self.enabled:
+            return
         
         try:
-            cursor.execute('''
-                INSERT INTO audit_logs (
-                    user_id, customer_id, operation_type, resource_type,
-                    resource_id, function_name, parameters, result_status,
-                    result_data, error_message, error_type, error_code,
-                    stack_trace, execution_time_ms, session_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                self.get_user_id(),
-                self.get_customer_id(),
+            user_id, customer_id, session_id = self._identity()
+            row = (
+                user_id,
+                customer_id,
                 operation_type,
                 resource_type,
                 resource_id,
                 function_name,
-                json.dumps(parameters) if parameters else None,
+                _dumps(parameters) if parameters else None,
                 result_status,
-                json.dumps(result_data) if result_data else None,
+                _dumps(result_data) if result_data else None,
                 error_message,
                 error_type,
                 error_code,
                 stack_trace,
                 execution_time_ms,
-                self.get_session_id()
-            ))
-            
-            conn.commit()
+                session_id,
+                int(time.time())
+            )
+        except Exception as e:
+            print(f"Error logging audit entry: {e}")
+            return
+        
+        self._enqueue(row)
+    
+    def log_success(self, operation_type: str, resource_type: str, function_name: str,
+                    parameters: Optional[Dict[str, Any]], resource_id: Optional[str],
+                    result_data: Any, execution_time_ms: int):
+        """Positional fast path of log_operation for successful calls with no error fields."""
+        if not self.enabled:
+            return
+        
+        try:
+            user_id, customer_id, session_id = self._identity()
+            row = (
+                user_id, customer_id, operation_type, resource_type, resource_id, function_name,
+                _dumps(parameters) if parameters else None, "SUCCESS",
+                _dumps(result_data) if result_data else None, None, None, None, None,
+                execution_time_ms, session_id, int(time.time())
+            )
         except Exception as e:
             print(f"Error logging audit entry: {e}")
-        finally:
-            conn.close()
+            return
+        
+        self._enqueue(row)
+    
+    def _enqueue(self, row: tuple):
+        """Hand a row to the writer thread without blocking, dropping it if the queue is full."""
+        if self._writer is None:
+            self._start()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count_dropped(1)
+    
+    def _count_dropped(self, count: int):
+        """Add to the dropped-entry counter."""
+        with self._dropped_lock:
+            self.dropped += count
+    
+    def _writer_loop(self):
+        """Drain queued rows into the database, one transaction per batch."""
+        conn = self._get_conn()
+        insert_sql = self._INSERT_SQL
+        
+        while True:
+            rows = [self._queue.get()]
+            deadline = time.monotonic() + self.BATCH_MAX_WAIT
+            while len(rows) < self.BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(insert_sql, rows)
+                conn.execute("COMMIT")
+            except Exception as e:
+                print(f"Error logging audit entries, retrying them one at a time: {e}")
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self._write_rows_individually(conn, rows)
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+    
+    def _write_rows_individually(self, conn: sqlite3.Connection, rows: List[tuple]):
+        """Insert rows one statement at a time so a bad row is dropped without the rest."""
+        bad_rows = 0
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for row in rows:
+                try:
+                    conn.execute(self._INSERT_SQL, row)
+                except Exception as e:
+                    # A failed INSERT is undone on its own; the transaction stays open
+                    print(f"Dropping audit entry that could not be written: {e}")
+                    bad_rows += 1
+            conn.execute("COMMIT")
+            if bad_rows:
+                self._count_dropped(bad_rows)
+        except Exception as e:
+            print(f"Error logging audit entries: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._count_dropped(len(rows))
+    
+    def flush(self):
+        """Block until every queued audit entry has been written."""
+        self._queue.join()
     
     def get_audit_logs(self, 
                       limit: int = 100,
@@ -146,67 +455,64 @@ class AuditLogger:
                       operation_type: str = None,
                       resource_type: str = None,
                       start_date: str = None,
-                      end_date: str = None) -> List[Dict]:
-        """Retrieve audit logs with optional filtering."""
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM audit_logs WHERE 1=1"
-        params = []
-        
-        if user_id:
-            query += " AND user_id = ?"
-            params.append(user_id)
-        
-        if customer_id:
-            query += " AND customer_id = ?"
-            params.append(customer_id)
+                      end_date: str = None,
+                      parse_json: bool = True) -> List[Dict]:
+        """Retrieve audit logs with optional filtering.
         
-        if operation_type:
-            query += " AND operation_type = ?"
-            params.append(operation_type)
+        Set parse_json=False to skip decoding the parameters and result_data fields.
+        """
         
-        if resource_type:
-            query += " AND resource_type = ?"
-            params.append(resource_type)
-        
-        if start_date:
-            query += " AND timestamp >= ?"
-            params.append(start_date)
-        
-        if end_date:
-            query += " AND timestamp <= ?"
-            params.append(end_date)
+        self._start()
+        self.flush()
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
         
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        filters = (user_id, customer_id, operation_type, resource_type, start_date, end_date)
+        active = tuple(i for i, value in enumerate(filters) if value)
+        params = [filters[i] for i in active]
         params.append(limit)
         
-        cursor.execute(query, params)
+        cursor.execute(self._audit_logs_query(active), params)
         
-        columns = [description[0] for description in cursor.description]
         results = []
         
-        for row in cursor.fetchall():
-            log_entry = dict(zip(columns, row))
-            # Parse JSON fields
+        # Iterate the cursor lazily so rows are not materialized twice
+        for row in cursor:
+            log_entry = dict(row)
+            compressed_trace = log_entry.pop('stack_trace_blob')
+            if compressed_trace is not None:
+                log_entry['stack_trace'] = zlib.decompress(compressed_trace).decode('utf-8')
+            
+            if not parse_json:
+                results.append(log_entry)
+                continue
+            
+            # Parse JSON fields (BLOB for new rows, TEXT for older ones)
             if log_entry['parameters']:
                 try:
-                    log_entry['parameters'] = json.loads(log_entry['parameters'])
+                    log_entry['parameters'] = _loads(log_entry['parameters'])
                 except json.JSONDecodeError:
                     pass
             
             if log_entry['result_data']:
                 try:
-                    log_entry['result_data'] = json.loads(log_entry['result_data'])
+                    log_entry['result_data'] = _loads(log_entry['result_data'])
                 except json.JSONDecodeError:
                     pass
             
             results.append(log_entry)
         
-        conn.close()
         return results
     
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _audit_logs_query(cls, active: tuple) -> str:
+        """Build (and cache) the get_audit_logs SQL for a set of active filter indexes."""
+        clauses = [cls._LOG_FILTER_CLAUSES[i] for i in active]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return f"SELECT * FROM audit_logs{where} ORDER BY timestamp DESC LIMIT ?"
+    
     def log_error(self, 
                   operation_type: str,
                   resource_type: str,
@@ -216,31 +522,10 @@ class AuditLogger:
                   resource_id: str = None,
                   execution_time_ms: int = None):
         """Helper method to manually log errors with detailed information."""
+        if not self.enabled:
+            return
         
-        # Extract detailed error information
-        error_type = type(error).__name__
-        error_code = None
-        error_message = str(error)
-        stack_trace = traceback.format_exc()
-        
-        # Try to extract Google Ads API specific error details
-        if hasattr(error, 'failure') and hasattr(error.failure, 'errors'):
-            # Google Ads API exception
-            errors = []
-            for err in error.failure.errors:
-                error_info = {
-                    'error_code': getattr(err, 'error_code', {}).get('name', 'UNKNOWN'),
-                    'message': getattr(err, 'message', str(err)),
-                    'location': getattr(err, 'location', None)
-                }
-                errors.append(error_info)
-                if error_code is None:  # Use the first error code
-                    error_code = error_info['error_code']
-            
-            error_message = f"Google Ads API Error: {json.dumps(errors)}"
-        elif hasattr(error, 'code'):
-            # HTTP or other errors with codes
-            error_code = str(error.code)
+        error_message, error_code, error_type = _extract_error_details(error)
         
         self.log_operation(
             operation_type=operation_type,
@@ -252,21 +537,34 @@ class AuditLogger:
             error_message=error_message,
             error_type=error_type,
             error_code=error_code,
-            stack_trace=stack_trace,
+            stack_trace=_LazyTrace(error),
             execution_time_ms=execution_time_ms
         )
     
     def get_operation_stats(self) -> Dict[str, Any]:
         """Get statistics about operations for dashboard."""
-        conn = sqlite3.connect(self.db_path)
+        self._start()
+        self.flush()
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         stats = {}
         
-        # Total operations
+        # Total operations and recent activity (last 24 hours); each count is a range
+        # scan of one index (idx_ts_epoch, idx_status_epoch) rather than of the table
+        cutoff = int(time.time()) - 86400
         cursor.execute("SELECT COUNT(*) FROM audit_logs")
         stats['total_operations'] = cursor.fetchone()[0]
         
+        cursor.execute("SELECT COUNT(*) FROM audit_logs WHERE ts_epoch >= ?", (cutoff,))
+        stats['operations_last_24h'] = cursor.fetchone()[0]
+        
+        cursor.execute("""
+            SELECT COUNT(*) FROM audit_logs
+            WHERE result_status IN ('ERROR', 'PARTIAL_FAILURE') AND ts_epoch >= ?
+        """, (cutoff,))
+        stats['errors_last_24h'] = cursor.fetchone()[0]
+        
         # Operations by type
         cursor.execute("""
             SELECT operation_type, COUNT(*) as count 
@@ -293,13 +591,6 @@ class AuditLogger:
         """)
         stats['status_breakdown'] = dict(cursor.fetchall())
         
-        # Recent activity (last 24 hours)
-        cursor.execute("""
-            SELECT COUNT(*) FROM audit_logs 
-            WHERE timestamp >= datetime('now', '-1 day')
-        """)
-        stats['operations_last_24h'] = cursor.fetchone()[0]
-        
         # Most active users
         cursor.execute("""
             SELECT user_id, COUNT(*) as count 
@@ -330,25 +621,162 @@ class AuditLogger:
         """)
         stats['top_error_codes'] = dict(cursor.fetchall())
         
-        # Recent errors (last 24 hours)
-        cursor.execute("""
-            SELECT COUNT(*) FROM audit_logs 
-            WHERE result_status = 'ERROR' AND timestamp >= datetime('now', '-1 day')
-        """)
-        stats['errors_last_24h'] = cursor.fetchone()[0]
-        
-        conn.close()
         return stats
+    
+    def archive_old_logs(self, keep_days: int = 90) -> int:
+        """Move entries older than keep_days into per-month archive databases.
+        
+        Archives are written next to the main database as <name>_YYYYMM.db and
+        recorded in the audit_log_archives table. Keeping the live table small
+        bounds index maintenance on every insert. Returns the number of rows moved.
+        """
+        self._start()
+        self.flush()
+        conn = self._get_conn()
+        cutoff = int(time.time()) - keep_days * 86400
+        base_path, ext = os.path.splitext(self.db_path)
+        
+        months = [row[0] for row in conn.execute(
+            "SELECT DISTINCT strftime('%Y%m', ts_epoch, 'unixepoch') FROM audit_logs WHERE ts_epoch < ?",
+            (cutoff,)
+        )]
+        
+        moved = 0
+        for month in months:
+            archive_path = f"{base_path}_{month}{ext or '.db'}"
+            month_filter = "ts_epoch < ? AND strftime('%Y%m', ts_epoch, 'unixepoch') = ?"
+            
+            conn.execute('ATTACH DATABASE ? AS archive', (archive_path,))
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute('CREATE TABLE IF NOT EXISTS archive.audit_logs AS SELECT * FROM main.audit_logs WHERE 0')
+                try:
+                    # Archives created before the column existed
+                    conn.execute('ALTER TABLE archive.audit_logs ADD COLUMN stack_trace_blob BLOB')
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+                count = conn.execute(
+                    f'INSERT INTO archive.audit_logs SELECT * FROM main.audit_logs WHERE {month_filter}',
+                    (cutoff, month)
+                ).rowcount
+                conn.execute(f'DELETE FROM main.audit_logs WHERE {month_filter}', (cutoff, month))
+                conn.execute('''
+                    INSERT INTO audit_log_archives (month, path, min_ts_epoch, max_ts_epoch, row_count)
+                    SELECT ?, ?, MIN(ts_epoch), MAX(ts_epoch), COUNT(*) FROM archive.audit_logs WHERE true
+                    ON CONFLICT(month) DO UPDATE SET
+                        min_ts_epoch = excluded.min_ts_epoch,
+                        max_ts_epoch = excluded.max_ts_epoch,
+                        row_count = excluded.row_count
+                ''', (month, archive_path))
+                conn.execute('COMMIT')
+                moved += count
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.execute('DETACH DATABASE archive')
+        
+        return moved
+    
+    def list_archives(self) -> List[Dict]:
+        """List the monthly archive databases and the time range each covers."""
+        self._start()
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute('SELECT * FROM audit_log_archives ORDER BY month DESC')
+        return [dict(row) for row in cursor]
+    
+    # Async variants for concurrent callers. Reads run on the default executor,
+    # where each worker thread keeps its own connection from _get_conn(), so the
+    # executor doubles as a connection pool. Logging is already non-blocking.
+    
+    async def alog_operation(self, *args, **kwargs):
+        """Async variant of log_operation."""
+        self.log_operation(*args, **kwargs)
+    
+    async def aget_audit_logs(self, **filters) -> List[Dict]:
+        """Async variant of get_audit_logs."""
+        return await asyncio.to_thread(self.get_audit_logs, **filters)
+    
+    async def aget_operation_stats(self) -> Dict[str, Any]:
+        """Async variant of get_operation_stats."""
+        return await asyncio.to_thread(self.get_operation_stats)
 
 # Global audit logger instance
 audit_logger = AuditLogger()
 
-def audit_log(operation_type: str, resource_type: str):
-    """Decorator to automatically log function calls."""
+# Keyword arguments never written to the audit log
+_SENSITIVE_KEYS = frozenset(('client', 'service', 'password', 'token'))
+
+def _error_code_text(error_code: Any) -> Optional[str]:
+    """Error code of a per-operation failure as stored text.
+    
+    The SDK reports a string, or a Google Ads ErrorCode message whose text form is
+    "<error_type>: <CODE>".
+    """
+    if error_code is None or isinstance(error_code, str):
+        return error_code
+    return str(error_code).strip()
+
+def _summarize_result(result: Any) -> tuple:
+    """Result status, resource ID and result data recorded for a single-resource call."""
+    resource_id = None
+    if hasattr(result, 'results') and result.results:
+        if hasattr(result.results[0], 'resource_name'):
+            resource_id = result.results[0].resource_name
+    elif isinstance(result, str) and '/' in result:
+        resource_id = result
+    
+    return "SUCCESS", resource_id, {"resource_count": len(result.results) if hasattr(result, 'results') else None}
+
+def _summarize_batch_result(result: Any) -> tuple:
+    """Result status, resource ID and result data recorded for a bulk call.
+    
+    The call returns (resource_names, failures), or just resource_names when it is
+    all-or-nothing and so has no per-operation failures. Any failure makes the call a
+    PARTIAL_FAILURE, recorded with each failure's index, error code and message.
+    """
+    if isinstance(result, tuple):
+        resource_names, failures = result
+    else:
+        resource_names, failures = result, ()
+    succeeded = [name for name in resource_names if name]
+    result_data = {
+        "resource_count": len(succeeded),
+        # Rejected operations, each of which may have several entries in failures
+        "failed_count": len(resource_names) - len(succeeded),
+        "resource_names": succeeded
+    }
+    if not failures:
+        return "SUCCESS", None, result_data
+    
+    result_data["failures"] = [
+        {
+            "index": failure.get('index'),
+            "error_code": _error_code_text(failure.get('error_code')),
+            "message": failure.get('message')
+        }
+        for failure in failures
+    ]
+    return "PARTIAL_FAILURE", None, result_data
+
+def _audit_decorator(operation_type: str, resource_type: str, summarize: Callable):
+    """Build an audit decorator recording calls that return as summarize(result) describes."""
+    if os.getenv('AUDIT_DISABLED') == '1':
+        def passthrough(func: Callable) -> Callable:
+            return func
+        return passthrough
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # A call that only queues an operation into a batch has created nothing yet;
+            # the batch records the real resource names when it is sent
+            if not audit_logger.enabled or kwargs.get('batch') is not None:
+                return func(*args, **kwargs)
+            
+            start_time = time.perf_counter_ns()
             
             # Extract parameters for logging (exclude sensitive data)
             log_params = {}
@@ -356,77 +784,80 @@ def audit_log(operation_type: str, resource_type: str):
                 log_params['args_count'] = len(args)
             if kwargs:
                 # Filter out sensitive parameters
-                filtered_kwargs = {k: v for k, v in kwargs.items() 
-                                 if k not in ['client', 'service', 'password', 'token']}
-                log_params.update(filtered_kwargs)
+                log_params.update({k: v for k, v in kwargs.items() if k not in _SENSITIVE_KEYS})
             
             try:
                 result = func(*args, **kwargs)
-                execution_time = int((time.time() - start_time) * 1000)
+                execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
                 
-                # Extract resource ID from result if possible
-                resource_id = None
-                if hasattr(result, 'results') and result.results:
-                    if hasattr(result.results[0], 'resource_name'):
-                        resource_id = result.results[0].resource_name
-                elif isinstance(result, str) and '/' in result:
-                    resource_id = result
-                
-                audit_logger.log_operation(
-                    operation_type=operation_type,
-                    resource_type=resource_type,
-                    function_name=func.__name__,
-                    parameters=log_params,
-                    resource_id=resource_id,
-                    result_status="SUCCESS",
-                    result_data={"resource_count": len(result.results) if hasattr(result, 'results') else None},
-                    execution_time_ms=execution_time
-                )
+                result_status, resource_id, result_data = summarize(result)
+                if result_status == "SUCCESS":
+                    audit_logger.log_success(
+                        operation_type, resource_type, func.__name__, log_params, resource_id,
+                        result_data, execution_time
+                    )
+                else:
+                    # Rejected operations of a non-atomic call; the first one fills the error columns
+                    first_failure = result_data['failures'][0]
+                    audit_logger.log_operation(
+                        operation_type=operation_type,
+                        resource_type=resource_type,
+                        function_name=func.__name__,
+                        parameters=log_params,
+                        resource_id=resource_id,
+                        result_status=result_status,
+                        result_data=result_data,
+                        error_message=first_failure['message'],
+                        error_code=first_failure['error_code'],
+                        execution_time_ms=execution_time
+                    )
                 
                 return result
                 
             except Exception as e:
-                execution_time = int((time.time() - start_time) * 1000)
+                execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
                 
-                # Extract detailed error information
-                error_type = type(e).__name__
-                error_code = None
-                error_message = str(e)
-                stack_trace = traceback.format_exc()
+                error_message, error_code, error_type = _extract_error_details(e)
                 
-                # Try to extract Google Ads API specific error details
-                if hasattr(e, 'failure') and hasattr(e.failure, 'errors'):
-                    # Google Ads API exception
-                    errors = []
-                    for error in e.failure.errors:
-                        error_info = {
-                            'error_code': getattr(error, 'error_code', {}).get('name', 'UNKNOWN'),
-                            'message': getattr(error, 'message', str(error)),
-                            'location': getattr(error, 'location', None)
-                        }
-                        errors.append(error_info)
-                        if error_code is None:  # Use the first error code
-                            error_code = error_info['error_code']
-                    
-                    error_message = f"Google Ads API Error: {json.dumps(errors)}"
-                elif hasattr(e, 'code'):
-                    # HTTP or other errors with codes
-                    error_code = str(e.code)
+                # A non-atomic call that raises after applying some operations (the SDK's
+                # PartialFailureError) is recorded with the resources it did create
+                created = getattr(e, 'resource_names', None)
+                result_status, result_data = "ERROR", None
+                if isinstance(created, list):
+                    result_status = "PARTIAL_FAILURE"
+                    result_data = _summarize_batch_result((created, getattr(e, 'api_errors', ())))[2]
                 
                 audit_logger.log_operation(
                     operation_type=operation_type,
                     resource_type=resource_type,
                     function_name=func.__name__,
                     parameters=log_params,
-                    result_status="ERROR",
+                    result_status=result_status,
+                    result_data=result_data,
                     error_message=error_message,
                     error_type=error_type,
                     error_code=error_code,
-                    stack_trace=stack_trace,
+                    stack_trace=_LazyTrace(e),
                     execution_time_ms=execution_time
                 )
                 
                 raise e
         
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def audit_log(operation_type: str, resource_type: str):
+    """Decorator to automatically log function calls.
+    
+    Returns functions unwrapped when AUDIT_DISABLED=1 is set at import time.
+    """
+    return _audit_decorator(operation_type, resource_type, _summarize_result)
+
+def audit_log_batch(operation_type: str, resource_type: str):
+    """Decorator for bulk calls returning (resource_names, failures) or resource_names.
+    
+    Writes one audit record per call listing every created or changed resource
+    and any rejected operations, instead of one record per resource. A call with
+    rejected operations is recorded as PARTIAL_FAILURE.
+    """
+    return _audit_decorator(operation_type, resource_type, _summarize_batch_result)
\ No newline at end of file
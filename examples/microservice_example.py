@@ -13,24 +13,164 @@ Demonstrates:
 
 import json
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import operator
+import os
+import socket
+import threading
+import time
+from typing import Dict, Any, NamedTuple, Optional
 from mai_ads_toolkit import GoogleAdsSDK, APIError, ValidationError, ConfigurationError
 
+# structlog writing orjson bytes skips the stdlib LogRecord/Formatter/Handler chain;
+# fall back to stdlib logging when either package is missing
+try:
+    import orjson
+    import structlog
+except ImportError:
+    structlog = None
+
+# msgspec encodes Struct instances straight to JSON bytes without an intermediate dict
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# Host and process identity never change for the life of the service,
+# so look them up once instead of on every log record
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+
+class ServiceContextFilter(logging.Filter):
+    """Attach the cached hostname and PID to every log record"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.hostname = _HOSTNAME
+        record.service_pid = _PID
+        return True
+
+
+def _add_service_context(logger, method_name, event_dict):
+    """structlog processor attaching the cached hostname and PID"""
+    event_dict["hostname"] = _HOSTNAME
+    event_dict["pid"] = _PID
+    return event_dict
+
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+LOG_LEVEL = logging.INFO
+
+if structlog is not None:
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            _add_service_context,
+            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+        logger_factory=structlog.BytesLoggerFactory(),
+        # Pin the bound logger after its first use instead of rebuilding it per call
+        cache_logger_on_first_use=True
+    )
+    logger = structlog.get_logger(__name__)
+else:
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(asctime)s %(hostname)s[%(service_pid)d] %(levelname)s %(name)s: %(message)s"
+    )
+    for _handler in logging.getLogger().handlers:
+        _handler.addFilter(ServiceContextFilter())
+    logger = logging.getLogger(__name__)
+
+# Level checks cached at import so disabled log calls cost a single global load
+_INFO_ENABLED = False
+_ERROR_ENABLED = False
+
+
+def refresh_log_level_flags():
+    """Re-read the logger's effective level; call after changing logging configuration"""
+    global _INFO_ENABLED, _ERROR_ENABLED
+    if structlog is not None:
+        # The structlog wrapper class filters against LOG_LEVEL fixed at configure time
+        _INFO_ENABLED = LOG_LEVEL <= logging.INFO
+        _ERROR_ENABLED = LOG_LEVEL <= logging.ERROR
+    else:
+        _INFO_ENABLED = logger.isEnabledFor(logging.INFO)
+        _ERROR_ENABLED = logger.isEnabledFor(logging.ERROR)
+
+
+refresh_log_level_flags()
+
+
+if msgspec is not None:
+    class ServiceResponse(msgspec.Struct, frozen=True):
+        """Standard service response format (immutable, no per-instance __dict__)"""
+        success: bool
+        data: Optional[Any] = None
+        error: Optional[str] = None
+        error_code: Optional[str] = None
+        details: Optional[Dict[str, Any]] = None
+    
+    _encode_json = msgspec.json.Encoder().encode
+    
+    def encode_response(response: ServiceResponse) -> bytes:
+        """Serialize a response to JSON bytes"""
+        return _encode_json(response)
+else:
+    # dataclass(slots=True) would need Python 3.10; NamedTuple gives the same layout on 3.9
+    class ServiceResponse(NamedTuple):
+        """Standard service response format (immutable, no per-instance __dict__)"""
+        success: bool
+        data: Optional[Any] = None
+        error: Optional[str] = None
+        error_code: Optional[str] = None
+        details: Optional[Dict[str, Any]] = None
+    
+    def encode_response(response: ServiceResponse) -> bytes:
+        """Serialize a response to JSON bytes"""
+        return json.dumps(response._asdict()).encode()
 
 
-@dataclass
-class ServiceResponse:
-    """Standard service response format"""
-    success: bool
-    data: Optional[Any] = None
-    error: Optional[str] = None
-    error_code: Optional[str] = None
-    details: Optional[Dict[str, Any]] = None
+# Pulls the fields list_campaigns needs out of an SDK campaign dict in one C-level call
+_CAMPAIGN_FIELDS = operator.itemgetter("id", "name", "status", "type", "budget_amount_micros")
+
+# Responses that never depend on the request are built once and shared
+_AUDIT_DISABLED_RESPONSE = ServiceResponse(
+    success=False,
+    error="Audit logging is not enabled",
+    error_code="AUDIT_DISABLED"
+)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting outbound API calls
+    
+    Allows bursts of up to ``max_rate`` calls, refilled at ``max_rate`` tokens
+    per ``time_period`` seconds. ``acquire`` blocks until a token is available.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.capacity = max_rate
+        self.refill_rate = max_rate / time_period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until the bucket has refilled enough"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.refill_rate
+            time.sleep(wait)
 
 
 class GoogleAdsService:
@@ -41,15 +181,30 @@ class GoogleAdsService:
     for use in microservices, APIs, or other applications.
     """
     
-    def __init__(self, sdk: GoogleAdsSDK):
+    __slots__ = ("sdk", "_limiter", "_list_cache", "_list_cache_lock")
+    
+    # Seconds a campaign listing is served from memory before the API is queried again
+    LIST_CACHE_TTL = 30.0
+    
+    def __init__(self, sdk: GoogleAdsSDK, max_calls_per_second: float = 10.0):
         """
         Initialize the service
         
         Args:
             sdk: Configured GoogleAdsSDK instance
+            max_calls_per_second: Client-side cap on Google Ads API calls
         """
         self.sdk = sdk
-        self.logger = logger
+        # Keeps bursts under the API's rate limits instead of relying on server-side throttling
+        self._limiter = RateLimiter(max_rate=max_calls_per_second, time_period=1.0)
+        # include_removed -> (expires_at, ServiceResponse)
+        self._list_cache: Dict[bool, tuple] = {}
+        self._list_cache_lock = threading.Lock()
+    
+    def invalidate_campaign_cache(self):
+        """Drop cached campaign listings, e.g. after a campaign is created or changed"""
+        with self._list_cache_lock:
+            self._list_cache.clear()
     
     def create_campaign_with_budget(self, 
                                    campaign_name: str,
@@ -71,44 +226,40 @@ class GoogleAdsService:
             ServiceResponse with campaign details or error
         """
         try:
-            self.logger.info(f"Creating campaign: {campaign_name}")
+            if _INFO_ENABLED:
+                logger.info("Creating campaign: %s", campaign_name)
             
-            # Step 1: Create budget
-            budget_resource_name = self.sdk.campaigns.create_campaign_budget(
-                budget_name=budget_name,
-                amount_micros=budget_micros
-            )
-            
-            # Step 2: Create campaign
-            campaign_resource_name = self.sdk.campaigns.create_campaign(
+            # Budget, campaign and geo targeting are created in a single API round-trip
+            self._limiter.acquire()
+            created = self.sdk.campaigns.create_campaign_with_budget(
                 campaign_name=campaign_name,
-                budget_resource_name=budget_resource_name,
+                budget_name=budget_name,
+                amount_micros=budget_micros,
                 campaign_type=campaign_type,
-                status="PAUSED"  # Start paused for safety
+                status="PAUSED",  # Start paused for safety
+                location_ids=geo_location_ids
             )
-            
-            # Step 3: Add geographic targeting if specified
-            geo_criteria = []
-            if geo_location_ids:
-                geo_criteria = self.sdk.campaigns.add_geo_targeting(
-                    campaign_resource_name=campaign_resource_name,
-                    location_ids=geo_location_ids
-                )
+            budget_resource_name = created["budget_resource_name"]
+            campaign_resource_name = created["campaign_resource_name"]
+            geo_count = len(created["geo_criteria"]) if geo_location_ids else 0
             
             # Prepare response data
             response_data = {
                 "campaign_resource_name": campaign_resource_name,
                 "budget_resource_name": budget_resource_name,
-                "geo_criteria_count": len(geo_criteria),
+                "geo_criteria_count": geo_count,
                 "status": "PAUSED"
             }
             
-            self.logger.info(f"Successfully created campaign: {campaign_resource_name}")
+            if _INFO_ENABLED:
+                logger.info("Successfully created campaign: %s", campaign_resource_name)
+            self.invalidate_campaign_cache()
             
             return ServiceResponse(success=True, data=response_data)
             
         except ValidationError as e:
-            self.logger.error(f"Validation error creating campaign: {e.message}")
+            if _ERROR_ENABLED:
+                logger.error("Validation error creating campaign: %s", e.message)
             return ServiceResponse(
                 success=False,
                 error=f"Validation error: {e.message}",
@@ -117,7 +268,8 @@ class GoogleAdsService:
             )
             
         except APIError as e:
-            self.logger.error(f"API error creating campaign: {e.message}")
+            if _ERROR_ENABLED:
+                logger.error("API error creating campaign: %s", e.message)
             return ServiceResponse(
                 success=False,
                 error=f"Google Ads API error: {e.message}",
@@ -126,7 +278,8 @@ class GoogleAdsService:
             )
             
         except Exception as e:
-            self.logger.error(f"Unexpected error creating campaign: {e}")
+            if _ERROR_ENABLED:
+                logger.error("Unexpected error creating campaign: %s", e)
             return ServiceResponse(
                 success=False,
                 error=f"Internal error: {str(e)}",
@@ -143,30 +296,41 @@ class GoogleAdsService:
         Returns:
             ServiceResponse with campaign list or error
         """
+        with self._list_cache_lock:
+            cached = self._list_cache.get(include_removed)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
+            self._limiter.acquire()
             campaigns = self.sdk.campaigns.list_campaigns(include_removed=include_removed)
             
             # Format response data
-            formatted_campaigns = []
-            for campaign in campaigns:
-                formatted_campaigns.append({
-                    "id": campaign["id"],
-                    "name": campaign["name"],
-                    "status": campaign["status"],
-                    "type": campaign["type"],
-                    "budget_amount_usd": campaign["budget_amount_micros"] / 1_000_000
-                })
+            formatted_campaigns = [
+                {
+                    "id": campaign_id,
+                    "name": name,
+                    "status": status,
+                    "type": campaign_type,
+                    "budget_amount_usd": budget_micros / 1_000_000
+                }
+                for campaign_id, name, status, campaign_type, budget_micros in map(_CAMPAIGN_FIELDS, campaigns)
+            ]
             
-            return ServiceResponse(
+            response = ServiceResponse(
                 success=True,
                 data={
                     "campaigns": formatted_campaigns,
                     "total_count": len(formatted_campaigns)
                 }
             )
+            with self._list_cache_lock:
+                self._list_cache[include_removed] = (time.monotonic() + self.LIST_CACHE_TTL, response)
+            return response
             
         except APIError as e:
-            self.logger.error(f"API error listing campaigns: {e.message}")
+            if _ERROR_ENABLED:
+                logger.error("API error listing campaigns: %s", e.message)
             return ServiceResponse(
                 success=False,
                 error=f"Failed to list campaigns: {e.message}",
@@ -187,10 +351,12 @@ class GoogleAdsService:
             ServiceResponse with updated campaign or error
         """
         try:
+            self._limiter.acquire()
             updated_resource = self.sdk.campaigns.update_campaign_status(
                 campaign_resource_name=campaign_resource_name,
                 status=status
             )
+            self.invalidate_campaign_cache()
             
             return ServiceResponse(
                 success=True,
@@ -223,11 +389,7 @@ class GoogleAdsService:
         """
         try:
             if not self.sdk._audit_logger:
-                return ServiceResponse(
-                    success=False,
-                    error="Audit logging is not enabled",
-                    error_code="AUDIT_DISABLED"
-                )
+                return _AUDIT_DISABLED_RESPONSE
             
             # Get statistics
             stats = self.sdk._audit_logger.get_statistics()
@@ -261,10 +423,19 @@ class GoogleAdsService:
 
 # Example Flask integration (commented out to avoid Flask dependency)
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 
 app = Flask(__name__)
 
+
+def json_response(response: ServiceResponse) -> Response:
+    # Encoded straight to bytes, skipping jsonify's dict copy and stdlib json pass
+    return Response(
+        encode_response(response),
+        status=200 if response.success else 400,
+        mimetype="application/json"
+    )
+
 # Initialize service
 sdk = GoogleAdsSDK(enable_audit_logging=True, audit_backend="database")
 ads_service = GoogleAdsService(sdk)
@@ -281,8 +452,7 @@ def create_campaign():
         geo_location_ids=data.get('geo_locations')
     )
     
-    status_code = 200 if response.success else 400
-    return jsonify(response.__dict__), status_code
+    return json_response(response)
 
 @app.route('/campaigns', methods=['GET'])
 def list_campaigns():
@@ -290,8 +460,7 @@ def list_campaigns():
     
     response = ads_service.list_campaigns(include_removed=include_removed)
     
-    status_code = 200 if response.success else 400
-    return jsonify(response.__dict__), status_code
+    return json_response(response)
 
 @app.route('/campaigns/<path:campaign_resource_name>/status', methods=['PUT'])
 def update_campaign_status(campaign_resource_name):
@@ -300,8 +469,7 @@ def update_campaign_status(campaign_resource_name):
     
     response = ads_service.update_campaign_status(campaign_resource_name, status)
     
-    status_code = 200 if response.success else 400
-    return jsonify(response.__dict__), status_code
+    return json_response(response)
 
 if __name__ == '__main__':
     app.run(debug=True)
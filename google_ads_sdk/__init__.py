@@ -5,7 +5,8 @@ Based on the working Streamlit app implementation
 
 from .core.client import GoogleAdsSDK
 from .core.auth import GoogleAdsCredentials
-from .core.exceptions import GoogleAdsSDKError, ValidationError, APIError
+from .core.exceptions import GoogleAdsSDKError, ValidationError, APIError, PartialFailureError, BatchJobTimeoutError
 
 __version__ = "1.0.0"
-__all__ = ["GoogleAdsSDK", "GoogleAdsCredentials", "GoogleAdsSDKError", "ValidationError", "APIError"]
\ No newline at end of file
+__all__ = ["GoogleAdsSDK", "GoogleAdsCredentials", "GoogleAdsSDKError", "ValidationError", "APIError",
+           "PartialFailureError", "BatchJobTimeoutError"]
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Access to the project-root audit logger module"""
+
+import importlib.util
+import os
+import sys
+
+_AUDIT_LOGGER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "audit_logger.py"
+)
+
+
+def import_audit_logger():
+    """Return the audit_logger module, loading it from the project root by file path if needed
+
+    The module is registered in sys.modules under its usual name, so the app and the SDK
+    share one AuditLogger (and one writer thread) however it was first imported.
+    sys.path is never modified.
+
+    Raises:
+        ImportError: If the module or one of its dependencies cannot be loaded
+    """
+    module = sys.modules.get("audit_logger")
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location("audit_logger", _AUDIT_LOGGER_PATH)
+    if spec is None or not os.path.exists(_AUDIT_LOGGER_PATH):
+        raise ImportError(f"audit_logger.py not found at {_AUDIT_LOGGER_PATH}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["audit_logger"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["audit_logger"]
+        raise
+    return module
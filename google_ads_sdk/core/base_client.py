@@ -1,50 +1,111 @@
 """Base Google Ads client implementation"""
 
+import functools
+import hashlib
+import operator
+import threading
+from typing import Any, Callable, Dict, Iterator, List
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.errors import GoogleAdsException
+from .audit import import_audit_logger
 from .auth import GoogleAdsCredentials
 from .exceptions import APIError
+from .query_cache import QueryCache
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_logger
+    audit_logger = import_audit_logger().audit_logger
 except ImportError as e:
     print(f"Warning: Could not import audit_logger: {e}")
     audit_logger = None
 
+
+# GoogleAdsClient instances shared across SDK instances with identical credentials,
+# keyed by a SHA-256 digest so the secrets themselves are not kept as dictionary keys
+_client_cache: Dict[bytes, GoogleAdsClient] = {}
+_client_cache_lock = threading.Lock()
+
+# Reads result.resource_name in C when mapped over a mutate response's results
+get_resource_name = operator.attrgetter("resource_name")
+
+
+def _noop_log_error(**kwargs):
+    """Stand-in for audit_logger.log_error when the audit logger is unavailable"""
+    return None
+
+
+def bind_audit_identity(func: Callable) -> Callable:
+    """Bind func to the calling session's audit identity so it can run on a worker thread
+    
+    Call this on the thread that owns the Streamlit session (or an event loop running on
+    it), then hand the result to asyncio.to_thread or an executor. Bind once per task.
+    """
+    if audit_logger is None:
+        return func
+    return functools.partial(audit_logger.identity_context().run, func)
+
 class BaseGoogleAdsClient:
     """Base client for Google Ads API operations"""
     
+    __slots__ = ("credentials", "client", "customer_id", "query_cache", "_service_cache", "_audit_log_error")
+    
+    # Default lifetime of query_cache entries; each manager stores with its own QUERY_CACHE_TTL
+    QUERY_CACHE_TTL = 60.0
+    
     def __init__(self, credentials: GoogleAdsCredentials):
         self.credentials = credentials
         self.client = None
         self.customer_id = None
+        # Read-only query results shared by every manager built on this client
+        self.query_cache = QueryCache(self.QUERY_CACHE_TTL)
+        self._service_cache: Dict[str, Any] = {}
+        self._audit_log_error = audit_logger.log_error if audit_logger is not None else _noop_log_error
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize the Google Ads client"""
         self.credentials.validate()
         
-        credentials_dict = {
-            "developer_token": self.credentials.developer_token,
-            "client_id": self.credentials.client_id,
-            "client_secret": self.credentials.client_secret,
-            "refresh_token": self.credentials.refresh_token,
-            "login_customer_id": self.credentials.login_customer_id,
-            "use_proto_plus": True
-        }
+        cache_key = hashlib.sha256(repr((
+            self.credentials.developer_token,
+            self.credentials.client_id,
+            self.credentials.client_secret,
+            self.credentials.refresh_token,
+            self.credentials.login_customer_id
+        )).encode("utf-8")).digest()
+        
+        # Held while loading so concurrent sessions with the same credentials build one client
+        with _client_cache_lock:
+            client = _client_cache.get(cache_key)
+            if client is None:
+                credentials_dict = {
+                    "developer_token": self.credentials.developer_token,
+                    "client_id": self.credentials.client_id,
+                    "client_secret": self.credentials.client_secret,
+                    "refresh_token": self.credentials.refresh_token,
+                    "login_customer_id": self.credentials.login_customer_id,
+                    "use_proto_plus": True
+                }
+                client = GoogleAdsClient.load_from_dict(credentials_dict)
+                _client_cache[cache_key] = client
         
-        self.client = GoogleAdsClient.load_from_dict(credentials_dict)
+        self.client = client
         self.customer_id = self.credentials.customer_id
+        self._service_cache.clear()
     
     def get_service(self, service_name: str):
-        """Get a Google Ads service by name"""
-        if not self.client:
-            raise Exception("Client not initialized")
-        return self.client.get_service(service_name)
+        """Get a Google Ads service by name, reusing the stub built on first request"""
+        service = self._service_cache.get(service_name)
+        if service is None:
+            if not self.client:
+                raise Exception("Client not initialized")
+            service = self.client.get_service(service_name)
+            self._service_cache[service_name] = service
+        return service
+    
+    def invalidate_query_cache(self) -> None:
+        """Drop the cached query results of every manager built on this client"""
+        self.query_cache.clear()
     
     def get_customer_service(self):
         return self.get_service("CustomerService")
@@ -82,35 +143,77 @@ class BaseGoogleAdsClient:
     def get_bidding_strategy_service(self):
         return self.get_service("BiddingStrategyService")
     
+    def get_batch_job_service(self):
+        return self.get_service("BatchJobService")
+    
     def get_google_ads_service(self):
         return self.get_service("GoogleAdsService")
     
+    def search_stream_rows(self, query: str) -> Iterator[Any]:
+        """Yield every row a GAQL query returns for this customer
+        
+        search_stream sends all rows over one server stream instead of one request per
+        page. Rows are yielded as their batches arrive, so the result can be read only once;
+        errors are raised while iterating, not when this is called.
+        """
+        stream = self.get_google_ads_service().search_stream(customer_id=self.customer_id, query=query)
+        for batch in stream:
+            yield from batch.results
+    
     def handle_exception(self, exception: GoogleAdsException) -> APIError:
         """Convert Google Ads exception to SDK exception"""
-        error_details = []
-        
-        for error in exception.failure.errors:
-            error_details.append({
+        error_details = [
+            {
                 'error_code': error.error_code,
                 'message': error.message,
                 'trigger': error.trigger.value if error.trigger else None,
                 'location': error.location
-            })
+            }
+            for error in exception.failure.errors
+        ]
         
+        code_name = exception.error.code().name
         api_error = APIError(
-            message=f"Google Ads API error: {exception.error.code().name}",
-            error_code=exception.error.code().name,
+            message=f"Google Ads API error: {code_name}",
+            error_code=code_name,
             api_errors=error_details
         )
         
-        # Log the error with enhanced details if audit logger is available
-        if audit_logger:
-            audit_logger.log_error(
-                operation_type="API_CALL",
-                resource_type="GOOGLE_ADS_API", 
-                function_name="handle_exception",
-                error=exception,
-                parameters={"customer_id": self.customer_id}
-            )
+        # Log the error with enhanced details (a no-op if audit logger is unavailable)
+        self._audit_log_error(
+            operation_type="API_CALL",
+            resource_type="GOOGLE_ADS_API", 
+            function_name="handle_exception",
+            error=exception,
+            parameters={"customer_id": self.customer_id}
+        )
+        
+        return api_error
+    
+    def partial_failure_errors(self, response: Any, index_offset: int = 0) -> List[Dict[str, Any]]:
+        """Extract per-operation errors from a mutate response sent with partial_failure
+        
+        Each error carries the ``index`` of the failed operation in the request, shifted by
+        index_offset so callers sending chunks can map it back to their own input.
+        """
+        return self.status_errors(response.partial_failure_error, index_offset)
+    
+    def status_errors(self, status: Any, index_offset: int = 0) -> List[Dict[str, Any]]:
+        """Extract the GoogleAdsFailure errors carried in a google.rpc.Status, as partial_failure_errors does"""
+        if not status or status.code == 0:
+            return []
+        
+        failure_type = type(self.client.get_type("GoogleAdsFailure"))
+        failures = []
+        for detail in status.details:
+            failure = failure_type.deserialize(detail.value)
+            for error in failure.errors:
+                path = error.location.field_path_elements
+                failures.append({
+                    'index': index_offset + path[0].index if path else None,
+                    'error_code': error.error_code,
+                    'message': error.message,
+                    'trigger': error.trigger.value if error.trigger else None
+                })
         
-        return api_error
\ No newline at end of file
+        return failures
\ No newline at end of file
@@ -15,4 +15,24 @@ class APIError(GoogleAdsSDKError):
     def __init__(self, message, error_code=None, api_errors=None):
         super().__init__(message)
         self.error_code = error_code
-        self.api_errors = api_errors or []
\ No newline at end of file
+        self.api_errors = api_errors or []
+
+class PartialFailureError(APIError):
+    """Raised when a non-atomic request applied some operations and rejected others
+    
+    resource_names lists every input's resource name in order, with empty strings for
+    the rejected ones described in api_errors; the others now exist.
+    """
+    def __init__(self, message, resource_names, error_code=None, api_errors=None):
+        super().__init__(message, error_code, api_errors)
+        self.resource_names = resource_names
+
+class BatchJobTimeoutError(APIError):
+    """Raised when a batch job does not finish within the time the caller waits for it
+    
+    The job keeps running on the API side and may still apply its operations.
+    batch_job_resource_name identifies it, so its results can be fetched later.
+    """
+    def __init__(self, message, batch_job_resource_name, error_code=None, api_errors=None):
+        super().__init__(message, error_code, api_errors)
+        self.batch_job_resource_name = batch_job_resource_name
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Short-lived in-memory cache for read-only query results"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class QueryCache:
+    """Thread-safe cache whose entries expire a fixed number of seconds after they are stored"""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expiry, value)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default self.ttl), evicting the oldest entry when full"""
+        expiry = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expiry, value)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+def cached_query(func: Callable) -> Callable:
+    """Serve a list-returning manager method from its client's shared query cache
+
+    Every manager built on one BaseGoogleAdsClient shares its query_cache, and writes
+    made through them clear it (see invalidates_query_cache), so a listing never outlives
+    a change made by the same SDK instance. Changes made elsewhere, such as another
+    session or the Google Ads UI, show up once the entry expires after the manager's
+    QUERY_CACHE_TTL seconds.
+
+    The cache key is the manager class, method name and arguments, which fully determine
+    the query sent. Callers may pass use_cache=False to force a fresh query; its result
+    replaces the cached one. The caller of a miss gets the rows that were cached, so it
+    must not modify them; hits get their own copies of the rows, which are flat dicts.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, use_cache: bool = True, **kwargs):
+        key = (type(self).__name__, func.__name__, args, tuple(sorted(kwargs.items())))
+        rows = self._query_cache.get(key) if use_cache else None
+        if rows is not None:
+            return [dict(row) for row in rows]
+
+        rows = func(self, *args, **kwargs)
+        self._query_cache.put(key, rows, self.QUERY_CACHE_TTL)
+        return rows
+    return wrapper
+
+
+def invalidates_query_cache(func: Callable) -> Callable:
+    """Clear the client's shared query cache after a manager method that writes
+
+    The cache is cleared even if the method raises, since a failed request may still
+    have applied some of its operations.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.base_client.invalidate_query_cache()
+    return wrapper
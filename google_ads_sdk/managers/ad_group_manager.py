@@ -1,17 +1,21 @@
 """Ad group and ad management functionality"""
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import warnings
+from typing import Optional, List, Dict, Any, Tuple
 from google.ads.googleads.errors import GoogleAdsException
 from google.protobuf import field_mask_pb2
-from ..core.base_client import BaseGoogleAdsClient
+from google.protobuf.internal import api_implementation
+from ..core.audit import import_audit_logger
+from ..core.base_client import BaseGoogleAdsClient, bind_audit_identity, get_resource_name
 from ..core.exceptions import APIError, ValidationError
+from ..core.query_cache import invalidates_query_cache
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_log
+    _audit_logger_module = import_audit_logger()
+    audit_log = _audit_logger_module.audit_log
+    audit_log_batch = _audit_logger_module.audit_log_batch
 except ImportError as e:
     print(f"Warning: Could not import audit_log: {e}")
     # Create a no-op decorator as fallback
@@ -19,225 +23,448 @@ except ImportError as e:
         def decorator(func):
             return func
         return decorator
+    audit_log_batch = audit_log
+
+# Listing ads decodes many nested AdTextAsset messages; the pure-Python protobuf
+# runtime is an order of magnitude slower at this than the compiled upb/cpp backends
+if api_implementation.Type() == "python":
+    warnings.warn(
+        "protobuf is using its pure-Python implementation, which makes listing ads much slower. "
+        "Upgrade with 'pip install --upgrade protobuf' and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python.",
+        RuntimeWarning,
+        stacklevel=2
+    )
 
 class AdGroupManager:
     """Manager for Google Ads ad group and ad operations"""
     
+    # Most operations sent in one mutate request; larger batches are split
+    MAX_OPERATIONS_PER_REQUEST = 5000
+    
+    # Update mask of the status updates, built once; assigning it to an operation copies it
+    _STATUS_MASK = field_mask_pb2.FieldMask(paths=["status"])
+    
+    # Fields list_ads always selects, and the ad text fields it selects only when asked for content
+    _AD_BASE_FIELDS = (
+        "ad_group_ad.ad.id",
+        "ad_group_ad.status",
+        "ad_group_ad.ad.type",
+        "ad_group.id",
+        "ad_group.name",
+        "campaign.id",
+        "campaign.name",
+    )
+    _AD_CONTENT_FIELDS = (
+        "ad_group_ad.ad.responsive_search_ad.headlines",
+        "ad_group_ad.ad.responsive_search_ad.descriptions",
+        "ad_group_ad.ad.final_urls",
+    )
+    
+    # Constant SELECT ... FROM prefixes of the listing queries, assembled once
+    _AD_SELECT_BASE = f"SELECT {', '.join(_AD_BASE_FIELDS)} FROM ad_group_ad"
+    _AD_SELECT_WITH_CONTENT = f"SELECT {', '.join(_AD_BASE_FIELDS + _AD_CONTENT_FIELDS)} FROM ad_group_ad"
+    _AD_GROUP_SELECT = (
+        "SELECT ad_group.id, ad_group.name, ad_group.status, ad_group.cpc_bid_micros, "
+        "campaign.id, campaign.name FROM ad_group"
+    )
+    # Complete list_ad_groups queries with and without removed ad groups; a campaign filter is appended
+    _AD_GROUPS_QUERY_ALL = _AD_GROUP_SELECT
+    _AD_GROUPS_QUERY_ACTIVE = f"{_AD_GROUP_SELECT} WHERE ad_group.status != 'REMOVED'"
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        
+        # Message classes and enums used on every operation, resolved once; get_type() does a
+        # registry lookup per call, while calling the class directly just builds the message
+        self._ad_group_operation_type = type(self.client.get_type("AdGroupOperation"))
+        self._ad_group_ad_operation_type = type(self.client.get_type("AdGroupAdOperation"))
+        self._ad_text_asset_type = type(self.client.get_type("AdTextAsset"))
+        self._ad_group_status_enum = self.client.enums.AdGroupStatusEnum
+        self._ad_group_ad_status_enum = self.client.enums.AdGroupAdStatusEnum
+        self._responsive_search_ad_type = int(self.client.enums.AdTypeEnum.RESPONSIVE_SEARCH_AD)
+    
+    def _ad_group_create_operation(self, name: str, campaign_resource_name: str,
+                                   cpc_bid_micros: Optional[int] = None, status: str = "ENABLED"):
+        """Build an AdGroupOperation that creates an ad group"""
+        ad_group_operation = self._ad_group_operation_type()
+        ad_group = ad_group_operation.create
+        
+        ad_group.name = name
+        ad_group.campaign = campaign_resource_name
+        ad_group.status = self._ad_group_status_enum[status]
+        
+        if cpc_bid_micros:
+            ad_group.cpc_bid_micros = cpc_bid_micros
+        
+        return ad_group_operation
+    
+    def _responsive_search_ad_operation(self, ad_group_resource_name: str, headlines: List[str],
+                                        descriptions: List[str], final_url: str, status: str = "ENABLED"):
+        """Build an AdGroupAdOperation that creates a responsive search ad"""
+        ad_group_ad_operation = self._ad_group_ad_operation_type()
+        ad_group_ad = ad_group_ad_operation.create
+        
+        ad_group_ad.ad_group = ad_group_resource_name
+        ad_group_ad.status = self._ad_group_ad_status_enum[status]
+        
+        # Create responsive search ad (Expanded Text Ads are deprecated in v20)
+        responsive_search_ad = ad_group_ad.ad.responsive_search_ad
+        
+        # Add headlines (minimum 3, maximum 15)
+        ad_text_asset_type = self._ad_text_asset_type
+        for headline in headlines:
+            responsive_search_ad.headlines.append(ad_text_asset_type(text=headline))
+        
+        # Add descriptions (minimum 2, maximum 4)
+        for description in descriptions:
+            responsive_search_ad.descriptions.append(ad_text_asset_type(text=description))
+        
+        ad_group_ad.ad.final_urls.append(final_url)
+        
+        return ad_group_ad_operation
+    
+    def _status_update_operation(self, operation_type, status_enum, resource_name: str, status: str):
+        """Build an update operation that only changes the status field"""
+        operation = operation_type()
+        resource = operation.update
+        
+        resource.resource_name = resource_name
+        resource.status = status_enum[status]
+        
+        operation.update_mask = self._STATUS_MASK
+        
+        return operation
+    
+    def _mutate(self, mutate, request_type: str, operations: List[Any],
+                partial_failure: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Send operations in as few mutate requests as the per-request limit allows
+        
+        Returns:
+            Resource names in input order (empty strings for rejected operations), and the
+            per-operation errors reported under partial failure, indexed into ``operations``
+        """
+        resource_names = []
+        failures = []
+        
+        for start in range(0, len(operations), self.MAX_OPERATIONS_PER_REQUEST):
+            # partial_failure is not a flattened argument, so it needs a full request object
+            request = self.client.get_type(request_type)
+            request.customer_id = self.customer_id
+            request.operations = operations[start:start + self.MAX_OPERATIONS_PER_REQUEST]
+            request.partial_failure = partial_failure
+            
+            response = mutate(request=request)
+            resource_names.extend(map(get_resource_name, response.results))
+            if partial_failure:
+                failures.extend(self.base_client.partial_failure_errors(response, index_offset=start))
+        
+        return resource_names, failures
+    
+    def _mutate_ad_groups(self, operations: List[Any],
+                          partial_failure: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Send ad group operations; see _mutate"""
+        return self._mutate(self.base_client.get_ad_group_service().mutate_ad_groups,
+                            "MutateAdGroupsRequest", operations, partial_failure)
+    
+    def _mutate_ad_group_ads(self, operations: List[Any],
+                             partial_failure: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Send ad group ad operations; see _mutate"""
+        return self._mutate(self.base_client.get_ad_group_ad_service().mutate_ad_group_ads,
+                            "MutateAdGroupAdsRequest", operations, partial_failure)
     
     @audit_log("CREATE", "AD_GROUP")
+    @invalidates_query_cache
     def create_ad_group(self, name: str, campaign_resource_name: str, cpc_bid_micros: Optional[int] = None, status: str = "ENABLED") -> Optional[str]:
         """Create an ad group"""
         try:
-            ad_group_service = self.base_client.get_ad_group_service()
-            
-            ad_group_operation = self.client.get_type("AdGroupOperation")
-            ad_group = ad_group_operation.create
-            
-            ad_group.name = name
-            ad_group.campaign = campaign_resource_name
-            ad_group.status = self.client.enums.AdGroupStatusEnum[status]
-            
-            if cpc_bid_micros:
-                ad_group.cpc_bid_micros = cpc_bid_micros
-            
-            response = ad_group_service.mutate_ad_groups(
-                customer_id=self.customer_id,
-                operations=[ad_group_operation]
-            )
-            
-            return response.results[0].resource_name
+            operation = self._ad_group_create_operation(name, campaign_resource_name, cpc_bid_micros, status)
+            resource_names, _ = self._mutate_ad_groups([operation])
+            return resource_names[0]
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def create_text_ad(self, ad_group_resource_name: str, headline1: str, headline2: str, description: str, final_url: str, 
-                      headline3: Optional[str] = None, description2: Optional[str] = None, status: str = "ENABLED") -> Optional[str]:
-        """Create a responsive search ad (text ad)"""
+    @audit_log_batch("CREATE", "AD_GROUP")
+    @invalidates_query_cache
+    def create_ad_groups_bulk(self, specs: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Create several ad groups with as few mutate requests as possible
+        
+        Args:
+            specs: One dict per ad group with create_ad_group's keyword arguments
+        
+        Returns:
+            Resource names in input order (empty strings for rejected entries), and one error
+            dict per rejected entry with its ``index`` in ``specs`` so only those can be retried
+        """
+        if not specs:
+            return [], []
+        
         try:
-            # Responsive Search Ads require minimum 3 headlines and 2 descriptions
-            if not headline3:
-                raise ValidationError("Responsive Search Ads require at least 3 headlines. Please provide headline3.")
-            if not description2:
-                raise ValidationError("Responsive Search Ads require at least 2 descriptions. Please provide description2.")
-            
-            ad_group_ad_service = self.base_client.get_ad_group_ad_service()
-            
-            ad_group_ad_operation = self.client.get_type("AdGroupAdOperation")
-            ad_group_ad = ad_group_ad_operation.create
-            
-            ad_group_ad.ad_group = ad_group_resource_name
-            ad_group_ad.status = self.client.enums.AdGroupAdStatusEnum[status]
+            operations = [self._ad_group_create_operation(**spec) for spec in specs]
+            return self._mutate_ad_groups(operations, partial_failure=True)
             
-            # Create responsive search ad (Expanded Text Ads are deprecated in v20)
-            responsive_search_ad = ad_group_ad.ad.responsive_search_ad
-            
-            # Add headlines (minimum 3 required)
-            headline_asset1 = self.client.get_type("AdTextAsset")
-            headline_asset1.text = headline1
-            responsive_search_ad.headlines.append(headline_asset1)
-            
-            headline_asset2 = self.client.get_type("AdTextAsset")
-            headline_asset2.text = headline2
-            responsive_search_ad.headlines.append(headline_asset2)
-            
-            headline_asset3 = self.client.get_type("AdTextAsset")
-            headline_asset3.text = headline3
-            responsive_search_ad.headlines.append(headline_asset3)
-            
-            # Add descriptions (minimum 2 required)
-            description_asset1 = self.client.get_type("AdTextAsset")
-            description_asset1.text = description
-            responsive_search_ad.descriptions.append(description_asset1)
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log("CREATE", "AD_GROUP")
+    @invalidates_query_cache
+    def create_ad_group_with_ad(self, name: str, campaign_resource_name: str, headlines: List[str],
+                                descriptions: List[str], final_url: str, cpc_bid_micros: Optional[int] = None,
+                                status: str = "ENABLED", ad_status: str = "ENABLED") -> Dict[str, str]:
+        """Create an ad group and its first responsive search ad in one mutate request
+        
+        The ad refers to the new ad group through a temporary resource name resolved by the API.
+        """
+        try:
+            ga_service = self.base_client.get_google_ads_service()
+            ad_group_temp_name = f"customers/{self.customer_id}/adGroups/-1"
             
-            description_asset2 = self.client.get_type("AdTextAsset")
-            description_asset2.text = description2
-            responsive_search_ad.descriptions.append(description_asset2)
+            ad_group_operation = self._ad_group_create_operation(name, campaign_resource_name, cpc_bid_micros, status)
+            ad_group_operation.create.resource_name = ad_group_temp_name
+            ad_group_mutate_operation = self.client.get_type("MutateOperation")
+            ad_group_mutate_operation.ad_group_operation = ad_group_operation
             
-            ad_group_ad.ad.final_urls.append(final_url)
+            ad_mutate_operation = self.client.get_type("MutateOperation")
+            ad_mutate_operation.ad_group_ad_operation = self._responsive_search_ad_operation(
+                ad_group_temp_name, headlines, descriptions, final_url, ad_status
+            )
             
-            response = ad_group_ad_service.mutate_ad_group_ads(
+            response = ga_service.mutate(
                 customer_id=self.customer_id,
-                operations=[ad_group_ad_operation]
+                mutate_operations=[ad_group_mutate_operation, ad_mutate_operation]
             )
             
-            return response.results[0].resource_name
+            operation_responses = response.mutate_operation_responses
+            return {
+                'ad_group_resource_name': operation_responses[0].ad_group_result.resource_name,
+                'ad_resource_name': operation_responses[1].ad_group_ad_result.resource_name
+            }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    def create_text_ad(self, ad_group_resource_name: str, headline1: str, headline2: str, description: str, final_url: str, 
+                      headline3: Optional[str] = None, description2: Optional[str] = None, status: str = "ENABLED") -> Optional[str]:
+        """Create a responsive search ad (text ad)"""
+        # Responsive Search Ads require minimum 3 headlines and 2 descriptions
+        if not headline3:
+            raise ValidationError("Responsive Search Ads require at least 3 headlines. Please provide headline3.")
+        if not description2:
+            raise ValidationError("Responsive Search Ads require at least 2 descriptions. Please provide description2.")
+        
+        return self.create_responsive_search_ad(
+            ad_group_resource_name, [headline1, headline2, headline3], [description, description2], final_url, status=status
+        )
+    
     @audit_log("CREATE", "AD")
+    @invalidates_query_cache
     def create_responsive_search_ad(self, ad_group_resource_name: str, headlines: List[str], descriptions: List[str], final_url: str, status: str = "ENABLED") -> Optional[str]:
         """Create a responsive search ad with multiple headlines and descriptions"""
         try:
-            ad_group_ad_service = self.base_client.get_ad_group_ad_service()
-            
-            ad_group_ad_operation = self.client.get_type("AdGroupAdOperation")
-            ad_group_ad = ad_group_ad_operation.create
-            
-            ad_group_ad.ad_group = ad_group_resource_name
-            ad_group_ad.status = self.client.enums.AdGroupAdStatusEnum[status]
-            
-            # Create responsive search ad
-            responsive_search_ad = ad_group_ad.ad.responsive_search_ad
-            
-            # Add headlines (minimum 3, maximum 15)
-            for headline in headlines:
-                headline_asset = self.client.get_type("AdTextAsset")
-                headline_asset.text = headline
-                responsive_search_ad.headlines.append(headline_asset)
-            
-            # Add descriptions (minimum 2, maximum 4)
-            for description in descriptions:
-                description_asset = self.client.get_type("AdTextAsset")
-                description_asset.text = description
-                responsive_search_ad.descriptions.append(description_asset)
-            
-            ad_group_ad.ad.final_urls.append(final_url)
-            
-            response = ad_group_ad_service.mutate_ad_group_ads(
-                customer_id=self.customer_id,
-                operations=[ad_group_ad_operation]
-            )
+            operation = self._responsive_search_ad_operation(ad_group_resource_name, headlines, descriptions, final_url, status)
+            resource_names, _ = self._mutate_ad_group_ads([operation])
+            return resource_names[0]
             
-            return response.results[0].resource_name
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("CREATE", "AD")
+    @invalidates_query_cache
+    def create_responsive_search_ads_bulk(self, specs: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Create several responsive search ads with as few mutate requests as possible
+        
+        Args:
+            specs: One dict per ad with create_responsive_search_ad's keyword arguments
+        
+        Returns:
+            Resource names in input order (empty strings for rejected entries), and one error
+            dict per rejected entry with its ``index`` in ``specs`` so only those can be retried
+        """
+        if not specs:
+            return [], []
+        
+        try:
+            operations = [self._responsive_search_ad_operation(**spec) for spec in specs]
+            return self._mutate_ad_group_ads(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "AD_GROUP")
+    @invalidates_query_cache
     def update_ad_group_status(self, ad_group_resource_name: str, status: str) -> Optional[str]:
         """Update ad group status"""
         try:
-            ad_group_service = self.base_client.get_ad_group_service()
-            
-            ad_group_operation = self.client.get_type("AdGroupOperation")
-            ad_group = ad_group_operation.update
-            
-            ad_group.resource_name = ad_group_resource_name
-            ad_group.status = self.client.enums.AdGroupStatusEnum[status]
-            
-            field_mask = field_mask_pb2.FieldMask()
-            field_mask.paths.append("status")
-            ad_group_operation.update_mask = field_mask
-            
-            response = ad_group_service.mutate_ad_groups(
-                customer_id=self.customer_id,
-                operations=[ad_group_operation]
+            operation = self._status_update_operation(
+                self._ad_group_operation_type, self._ad_group_status_enum, ad_group_resource_name, status
             )
+            resource_names, _ = self._mutate_ad_groups([operation])
+            return resource_names[0]
             
-            return response.results[0].resource_name
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("UPDATE", "AD_GROUP")
+    @invalidates_query_cache
+    def update_ad_group_statuses_bulk(self, statuses: Dict[str, str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Update the status of several ad groups with as few mutate requests as possible
+        
+        Args:
+            statuses: Mapping of ad group resource name to new status
+        
+        Returns:
+            Resource names and the rejected entries' errors, as create_ad_groups_bulk
+        """
+        if not statuses:
+            return [], []
+        
+        try:
+            operations = [
+                self._status_update_operation(
+                    self._ad_group_operation_type, self._ad_group_status_enum, resource_name, status
+                )
+                for resource_name, status in statuses.items()
+            ]
+            return self._mutate_ad_groups(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "AD")
+    @invalidates_query_cache
     def update_ad_status(self, ad_resource_name: str, status: str) -> Optional[str]:
         """Update ad status"""
         try:
-            ad_group_ad_service = self.base_client.get_ad_group_ad_service()
-            
-            ad_group_ad_operation = self.client.get_type("AdGroupAdOperation")
-            ad_group_ad = ad_group_ad_operation.update
-            
-            ad_group_ad.resource_name = ad_resource_name
-            ad_group_ad.status = self.client.enums.AdGroupAdStatusEnum[status]
-            
-            field_mask = field_mask_pb2.FieldMask()
-            field_mask.paths.append("status")
-            ad_group_ad_operation.update_mask = field_mask
-            
-            response = ad_group_ad_service.mutate_ad_group_ads(
-                customer_id=self.customer_id,
-                operations=[ad_group_ad_operation]
+            operation = self._status_update_operation(
+                self._ad_group_ad_operation_type, self._ad_group_ad_status_enum, ad_resource_name, status
             )
+            resource_names, _ = self._mutate_ad_group_ads([operation])
+            return resource_names[0]
             
-            return response.results[0].resource_name
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("UPDATE", "AD")
+    @invalidates_query_cache
+    def update_ad_statuses_bulk(self, statuses: Dict[str, str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Update the status of several ads with as few mutate requests as possible
+        
+        Args:
+            statuses: Mapping of ad group ad resource name to new status
+        
+        Returns:
+            Resource names and the rejected entries' errors, as create_ad_groups_bulk
+        """
+        if not statuses:
+            return [], []
+        
+        try:
+            operations = [
+                self._status_update_operation(
+                    self._ad_group_ad_operation_type, self._ad_group_ad_status_enum, resource_name, status
+                )
+                for resource_name, status in statuses.items()
+            ]
+            return self._mutate_ad_group_ads(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("REMOVE", "AD")
+    @invalidates_query_cache
     def remove_ad(self, ad_resource_name: str) -> Optional[str]:
         """Remove an ad"""
         try:
-            ad_group_ad_service = self.base_client.get_ad_group_ad_service()
-            
-            ad_group_ad_operation = self.client.get_type("AdGroupAdOperation")
+            ad_group_ad_operation = self._ad_group_ad_operation_type()
             ad_group_ad_operation.remove = ad_resource_name
             
-            response = ad_group_ad_service.mutate_ad_group_ads(
-                customer_id=self.customer_id,
-                operations=[ad_group_ad_operation]
-            )
+            resource_names, _ = self._mutate_ad_group_ads([ad_group_ad_operation])
+            return resource_names[0]
+            
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("REMOVE", "AD")
+    @invalidates_query_cache
+    def remove_ads_bulk(self, ad_resource_names: List[str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Remove several ads with as few mutate requests as possible
+        
+        Returns:
+            Resource names and the rejected entries' errors, as create_ad_groups_bulk
+        """
+        if not ad_resource_names:
+            return [], []
+        
+        try:
+            operations = []
+            for ad_resource_name in ad_resource_names:
+                ad_group_ad_operation = self._ad_group_ad_operation_type()
+                ad_group_ad_operation.remove = ad_resource_name
+                operations.append(ad_group_ad_operation)
             
-            return response.results[0].resource_name
+            return self._mutate_ad_group_ads(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    async def aupdate_ad_status(self, ad_resource_name: str, status: str) -> Optional[str]:
+        """Async variant of update_ad_status."""
+        return await asyncio.to_thread(bind_audit_identity(self.update_ad_status), ad_resource_name, status)
+    
+    async def aremove_ad(self, ad_resource_name: str) -> Optional[str]:
+        """Async variant of remove_ad."""
+        return await asyncio.to_thread(bind_audit_identity(self.remove_ad), ad_resource_name)
+    
+    async def aupdate_ad_statuses(self, statuses: Dict[str, str],
+                                  max_parallel: int = 8) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Update ad statuses as independent requests running concurrently
+        
+        Unlike update_ad_statuses_bulk, each ad succeeds or fails on its own request, and a
+        failure does not stop or hide the others.
+        
+        Args:
+            statuses: Mapping of ad group ad resource name to new status
+            max_parallel: Most requests in flight at once, to stay within API quotas
+        
+        Returns:
+            Resource names in the order of statuses (empty strings for failed updates), and one
+            error dict per failed update with its ``index`` in statuses, as the *_bulk methods return
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        async def update(ad_resource_name: str, status: str) -> Optional[str]:
+            async with semaphore:
+                return await self.aupdate_ad_status(ad_resource_name, status)
+        
+        outcomes = await asyncio.gather(
+            *(update(name, status) for name, status in statuses.items()),
+            return_exceptions=True
+        )
+        
+        resource_names = []
+        failures = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                resource_names.append("")
+                failures.append({
+                    'index': index,
+                    'error_code': getattr(outcome, 'error_code', None),
+                    'message': str(outcome),
+                    'trigger': None
+                })
+            else:
+                resource_names.append(outcome or "")
+        
+        return resource_names, failures
+    
     def list_ad_groups(self, campaign_id: Optional[str] = None, include_removed: bool = False) -> List[Dict[str, Any]]:
         """List ad groups"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    ad_group.id,
-                    ad_group.name,
-                    ad_group.status,
-                    ad_group.cpc_bid_micros,
-                    campaign.id,
-                    campaign.name
-                FROM ad_group
-            """
-            
-            conditions = []
-            if not include_removed:
-                conditions.append("ad_group.status != 'REMOVED'")
+            query = self._AD_GROUPS_QUERY_ALL if include_removed else self._AD_GROUPS_QUERY_ACTIVE
             
             if campaign_id:
                 # Convert campaign ID to resource name if needed
@@ -245,23 +472,27 @@ class AdGroupManager:
                     campaign_resource_name = campaign_id
                 else:
                     campaign_resource_name = f"customers/{self.customer_id}/campaigns/{campaign_id}"
-                conditions.append(f"ad_group.campaign = '{campaign_resource_name}'")
+                clause = " WHERE " if include_removed else " AND "
+                query = f"{query}{clause}ad_group.campaign = '{campaign_resource_name}'"
             
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-            
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
             ad_groups = []
-            for row in response:
-                ad_groups.append({
-                    'id': row.ad_group.id,
-                    'name': row.ad_group.name,
-                    'status': row.ad_group.status.name,
-                    'cpc_bid_micros': row.ad_group.cpc_bid_micros,
-                    'campaign_id': row.campaign.id,
-                    'campaign_name': row.campaign.name,
-                    'resource_name': f"customers/{self.customer_id}/adGroups/{row.ad_group.id}"
+            ad_groups_append = ad_groups.append
+            resource_prefix = f"customers/{self.customer_id}/adGroups/"
+            for row in rows:
+                # Bind each nested message once; every proto-plus attribute hop allocates a wrapper
+                ad_group = row.ad_group
+                campaign = row.campaign
+                ad_group_id = ad_group.id
+                ad_groups_append({
+                    'id': ad_group_id,
+                    'name': ad_group.name,
+                    'status': ad_group.status.name,
+                    'cpc_bid_micros': ad_group.cpc_bid_micros,
+                    'campaign_id': campaign.id,
+                    'campaign_name': campaign.name,
+                    'resource_name': f"{resource_prefix}{ad_group_id}"
                 })
             
             return ad_groups
@@ -269,26 +500,18 @@ class AdGroupManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def list_ads(self, ad_group_id: Optional[str] = None, include_removed: bool = False) -> List[Dict[str, Any]]:
-        """List ads"""
+    def list_ads(self, ad_group_id: Optional[str] = None, include_removed: bool = False,
+                 include_content: bool = True, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List ads
+        
+        Args:
+            ad_group_id: Only list ads in this ad group (ID or resource name)
+            include_removed: Whether to include removed ads
+            include_content: Whether to fetch headlines, descriptions and final URLs, which
+                dominate the response size; without them only IDs, names, status and type are returned
+            limit: Maximum number of ads the API should return
+        """
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    ad_group_ad.ad.id,
-                    ad_group_ad.status,
-                    ad_group_ad.ad.type,
-                    ad_group_ad.ad.responsive_search_ad.headlines,
-                    ad_group_ad.ad.responsive_search_ad.descriptions,
-                    ad_group_ad.ad.final_urls,
-                    ad_group.id,
-                    ad_group.name,
-                    campaign.id,
-                    campaign.name
-                FROM ad_group_ad
-            """
-            
             conditions = []
             if not include_removed:
                 conditions.append("ad_group_ad.status != 'REMOVED'")
@@ -301,42 +524,86 @@ class AdGroupManager:
                     ad_group_resource_name = f"customers/{self.customer_id}/adGroups/{ad_group_id}"
                 conditions.append(f"ad_group_ad.ad_group = '{ad_group_resource_name}'")
             
+            query_parts = [self._AD_SELECT_WITH_CONTENT if include_content else self._AD_SELECT_BASE]
             if conditions:
-                query += " WHERE " + " AND ".join(conditions)
+                query_parts.append(" WHERE ")
+                query_parts.append(" AND ".join(conditions))
+            if limit:
+                query_parts.append(f" LIMIT {int(limit)}")
+            query = "".join(query_parts)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
             ads = []
-            for row in response:
-                ad_data = {
-                    'ad_id': row.ad_group_ad.ad.id,
-                    'status': row.ad_group_ad.status.name,
-                    'type': row.ad_group_ad.ad.type_.name,
-                    'ad_group_id': row.ad_group.id,
-                    'ad_group_name': row.ad_group.name,
-                    'campaign_id': row.campaign.id,
-                    'campaign_name': row.campaign.name,
-                    'resource_name': f"customers/{self.customer_id}/adGroupAds/{row.ad_group.id}~{row.ad_group_ad.ad.id}"
-                }
+            ads_append = ads.append
+            resource_prefix = f"customers/{self.customer_id}/adGroupAds/"
+            responsive_search_ad_type = self._responsive_search_ad_type
+            for row in rows:
+                # Bind each nested message once; every proto-plus attribute hop allocates a wrapper
+                ad_group_ad = row.ad_group_ad
+                ad = ad_group_ad.ad
+                ad_group = row.ad_group
+                campaign = row.campaign
+                ad_id = ad.id
+                ad_group_id = ad_group.id
+                ad_type = ad.type_
+                type_name = ad_type.name
+                
+                status_name = ad_group_ad.status.name
+                
+                if not include_content:
+                    ads_append({
+                        'ad_id': ad_id,
+                        'status': status_name,
+                        'type': type_name,
+                        'ad_group_id': ad_group_id,
+                        'ad_group_name': ad_group.name,
+                        'campaign_id': campaign.id,
+                        'campaign_name': campaign.name,
+                        'resource_name': f"{resource_prefix}{ad_group_id}~{ad_id}"
+                    })
+                    continue
                 
                 # Extract ad content if it's a responsive search ad
-                if row.ad_group_ad.ad.type_.name == 'RESPONSIVE_SEARCH_AD' and row.ad_group_ad.ad.responsive_search_ad:
-                    headlines = row.ad_group_ad.ad.responsive_search_ad.headlines
-                    if headlines:
-                        ad_data['headline1'] = headlines[0].text if len(headlines) > 0 else ''
-                        ad_data['headline2'] = headlines[1].text if len(headlines) > 1 else ''
-                        ad_data['headline3'] = headlines[2].text if len(headlines) > 2 else ''
+                # Compared by enum value; responsive_search_ad is only touched for RSA rows,
+                # since reading the oneof on other ads still allocates an empty wrapper
+                headline1 = headline2 = headline3 = description1 = description2 = ''
+                if ad_type == responsive_search_ad_type:
+                    responsive_search_ad = ad.responsive_search_ad
+                    headlines = responsive_search_ad.headlines
+                    headline_count = len(headlines)
+                    if headline_count:
+                        headline1 = headlines[0].text
+                        if headline_count > 1:
+                            headline2 = headlines[1].text
+                        if headline_count > 2:
+                            headline3 = headlines[2].text
                     
-                    descriptions = row.ad_group_ad.ad.responsive_search_ad.descriptions
+                    descriptions = responsive_search_ad.descriptions
                     if descriptions:
-                        ad_data['description1'] = descriptions[0].text if len(descriptions) > 0 else ''
-                        ad_data['description2'] = descriptions[1].text if len(descriptions) > 1 else ''
+                        description1 = descriptions[0].text
+                        if len(descriptions) > 1:
+                            description2 = descriptions[1].text
                 
-                # Extract final URLs
-                if row.ad_group_ad.ad.final_urls:
-                    ad_data['final_url'] = row.ad_group_ad.ad.final_urls[0]
+                final_urls = ad.final_urls
                 
-                ads.append(ad_data)
+                # Built in one literal so each row dict is allocated at its final size
+                ads_append({
+                    'ad_id': ad_id,
+                    'status': status_name,
+                    'type': type_name,
+                    'ad_group_id': ad_group_id,
+                    'ad_group_name': ad_group.name,
+                    'campaign_id': campaign.id,
+                    'campaign_name': campaign.name,
+                    'resource_name': f"{resource_prefix}{ad_group_id}~{ad_id}",
+                    'headline1': headline1,
+                    'headline2': headline2,
+                    'headline3': headline3,
+                    'description1': description1,
+                    'description2': description2,
+                    'final_url': final_urls[0] if final_urls else None
+                })
             
             return ads
             
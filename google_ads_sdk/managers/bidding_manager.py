@@ -2,16 +2,16 @@
 
 from typing import Optional, List, Dict, Any
 from google.ads.googleads.errors import GoogleAdsException
+from google.api_core import protobuf_helpers
 from google.protobuf import field_mask_pb2
+from ..core.audit import import_audit_logger
 from ..core.base_client import BaseGoogleAdsClient
+from ..core.query_cache import cached_query, invalidates_query_cache
 from ..core.exceptions import APIError, ValidationError
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_log
+    audit_log = import_audit_logger().audit_log
 except ImportError as e:
     print(f"Warning: Could not import audit_log: {e}")
     # Create a no-op decorator as fallback
@@ -23,10 +23,25 @@ except ImportError as e:
 class BiddingManager:
     """Manager for Google Ads bidding strategy operations"""
     
+    _LIST_BIDDING_STRATEGIES_QUERY = (
+        "SELECT bidding_strategy.id, bidding_strategy.name, bidding_strategy.type, "
+        "bidding_strategy.target_cpa.target_cpa_micros, bidding_strategy.target_roas.target_roas "
+        "FROM bidding_strategy "
+        "WHERE bidding_strategy.type IN ('TARGET_CPA', 'TARGET_ROAS', 'MAXIMIZE_CONVERSIONS')"
+    )
+    
+    # Seconds a list_bidding_strategies result is served from memory
+    QUERY_CACHE_TTL = 60.0
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        self._query_cache = client.query_cache
+    
+    def invalidate_query_cache(self) -> None:
+        """Drop cached query results, this manager's and those of the others on its client"""
+        self.base_client.invalidate_query_cache()
     
     def create_target_cpa_bidding_strategy(self, name: str, target_cpa_micros: int) -> Optional[str]:
         """Create a Target CPA bidding strategy"""
@@ -43,6 +58,7 @@ class BiddingManager:
                 customer_id=self.customer_id,
                 operations=[bidding_strategy_operation]
             )
+            self.invalidate_query_cache()
             
             return response.results[0].resource_name
             
@@ -64,6 +80,7 @@ class BiddingManager:
                 customer_id=self.customer_id,
                 operations=[bidding_strategy_operation]
             )
+            self.invalidate_query_cache()
             
             return response.results[0].resource_name
             
@@ -71,6 +88,7 @@ class BiddingManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "BIDDING_STRATEGY")
+    @invalidates_query_cache
     def apply_bidding_strategy_to_campaign(self, campaign_resource_name: str, bidding_strategy_type: str, **kwargs) -> bool:
         """Apply a bidding strategy to a campaign"""
         try:
@@ -81,47 +99,40 @@ class BiddingManager:
             
             campaign.resource_name = campaign_resource_name
             
-            # Apply different bidding strategy types
+            # Apply different bidding strategy types. The mask paths are listed explicitly rather
+            # than diffed from the message, since a diff would drop fields deliberately set to
+            # their default (e.g. enhanced_cpc_enabled=False, or clearing target_cpa_micros)
+            mask_paths = ["bidding_strategy_type"]
+            
             if bidding_strategy_type == "TARGET_CPA":
                 campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.TARGET_CPA
                 if 'target_cpa_micros' in kwargs:
                     campaign.target_cpa.target_cpa_micros = kwargs['target_cpa_micros']
-                
-                field_mask = field_mask_pb2.FieldMask()
-                field_mask.paths.append("bidding_strategy_type")
-                field_mask.paths.append("target_cpa.target_cpa_micros")
-                campaign_operation.update_mask = field_mask
+                mask_paths.append("target_cpa.target_cpa_micros")
                 
             elif bidding_strategy_type == "TARGET_ROAS":
                 campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.TARGET_ROAS
                 if 'target_roas' in kwargs:
                     campaign.target_roas.target_roas = kwargs['target_roas']
-                
-                field_mask = field_mask_pb2.FieldMask()
-                field_mask.paths.append("bidding_strategy_type")
-                field_mask.paths.append("target_roas.target_roas")
-                campaign_operation.update_mask = field_mask
+                mask_paths.append("target_roas.target_roas")
                 
             elif bidding_strategy_type == "MAXIMIZE_CONVERSIONS":
                 campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.MAXIMIZE_CONVERSIONS
                 if 'target_spend_micros' in kwargs:
                     campaign.maximize_conversions.target_spend_micros = kwargs['target_spend_micros']
-                
-                field_mask = field_mask_pb2.FieldMask()
-                field_mask.paths.append("bidding_strategy_type")
-                if 'target_spend_micros' in kwargs:
-                    field_mask.paths.append("maximize_conversions.target_spend_micros")
-                campaign_operation.update_mask = field_mask
+                    mask_paths.append("maximize_conversions.target_spend_micros")
                 
             elif bidding_strategy_type == "MANUAL_CPC":
                 campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.MANUAL_CPC
                 enhanced_cpc_enabled = kwargs.get('enhanced_cpc_enabled', False)
                 campaign.manual_cpc.enhanced_cpc_enabled = enhanced_cpc_enabled
-                
-                field_mask = field_mask_pb2.FieldMask()
-                field_mask.paths.append("bidding_strategy_type")
-                field_mask.paths.append("manual_cpc.enhanced_cpc_enabled")
-                campaign_operation.update_mask = field_mask
+                mask_paths.append("manual_cpc.enhanced_cpc_enabled")
+            
+            else:
+                mask_paths = None
+            
+            if mask_paths:
+                campaign_operation.update_mask = field_mask_pb2.FieldMask(paths=mask_paths)
             
             response = campaign_service.mutate_campaigns(
                 customer_id=self.customer_id,
@@ -133,40 +144,37 @@ class BiddingManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    @cached_query
     def list_bidding_strategies(self) -> List[Dict[str, Any]]:
-        """List all bidding strategies"""
+        """List all bidding strategies
+        
+        Results are cached for QUERY_CACHE_TTL seconds, since callers typically resolve
+        strategy names before each apply_bidding_strategy_to_campaign call.
+        """
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    bidding_strategy.id,
-                    bidding_strategy.name,
-                    bidding_strategy.type,
-                    bidding_strategy.target_cpa.target_cpa_micros,
-                    bidding_strategy.target_roas.target_roas
-                FROM bidding_strategy
-                WHERE bidding_strategy.type IN ('TARGET_CPA', 'TARGET_ROAS', 'MAXIMIZE_CONVERSIONS')
-            """
-            
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(self._LIST_BIDDING_STRATEGIES_QUERY)
             
             strategies = []
-            for row in response:
+            strategies_append = strategies.append
+            resource_prefix = f"customers/{self.customer_id}/biddingStrategies/"
+            for row in rows:
+                bidding_strategy = row.bidding_strategy
+                strategy_id = bidding_strategy.id
+                type_name = bidding_strategy.type_.name
                 strategy_data = {
-                    'id': row.bidding_strategy.id,
-                    'name': row.bidding_strategy.name,
-                    'type': row.bidding_strategy.type_.name,
-                    'resource_name': f"customers/{self.customer_id}/biddingStrategies/{row.bidding_strategy.id}"
+                    'id': strategy_id,
+                    'name': bidding_strategy.name,
+                    'type': type_name,
+                    'resource_name': f"{resource_prefix}{strategy_id}"
                 }
                 
                 # Add type-specific data
-                if row.bidding_strategy.type_.name == 'TARGET_CPA':
-                    strategy_data['target_cpa_micros'] = row.bidding_strategy.target_cpa.target_cpa_micros
-                elif row.bidding_strategy.type_.name == 'TARGET_ROAS':
-                    strategy_data['target_roas'] = row.bidding_strategy.target_roas.target_roas
+                if type_name == 'TARGET_CPA':
+                    strategy_data['target_cpa_micros'] = bidding_strategy.target_cpa.target_cpa_micros
+                elif type_name == 'TARGET_ROAS':
+                    strategy_data['target_roas'] = bidding_strategy.target_roas.target_roas
                 
-                strategies.append(strategy_data)
+                strategies_append(strategy_data)
             
             return strategies
             
@@ -183,29 +191,29 @@ class BiddingManager:
             
             bidding_strategy.resource_name = strategy_resource_name
             
-            field_mask = field_mask_pb2.FieldMask()
-            
             # Update name if provided
             if 'name' in kwargs:
                 bidding_strategy.name = kwargs['name']
-                field_mask.paths.append("name")
             
             # Update Target CPA
             if 'target_cpa_micros' in kwargs:
                 bidding_strategy.target_cpa.target_cpa_micros = kwargs['target_cpa_micros']
-                field_mask.paths.append("target_cpa.target_cpa_micros")
             
             # Update Target ROAS
             if 'target_roas' in kwargs:
                 bidding_strategy.target_roas.target_roas = kwargs['target_roas']
-                field_mask.paths.append("target_roas.target_roas")
             
-            bidding_strategy_operation.update_mask = field_mask
+            # Derive the mask from the fields actually set on the message
+            self.client.copy_from(
+                bidding_strategy_operation.update_mask,
+                protobuf_helpers.field_mask(None, bidding_strategy._pb)
+            )
             
             response = bidding_strategy_service.mutate_bidding_strategies(
                 customer_id=self.customer_id,
                 operations=[bidding_strategy_operation]
             )
+            self.invalidate_query_cache()
             
             return True
             
@@ -1,17 +1,20 @@
 """Campaign management functionality"""
 
+import asyncio
+import operator
 from typing import Optional, List, Dict, Any
 from google.ads.googleads.errors import GoogleAdsException
 from google.protobuf import field_mask_pb2
-from ..core.base_client import BaseGoogleAdsClient
+from ..core.audit import import_audit_logger
+from ..core.base_client import BaseGoogleAdsClient, bind_audit_identity, get_resource_name
 from ..core.exceptions import APIError, ValidationError
+from ..core.query_cache import invalidates_query_cache
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_log
+    _audit_logger_module = import_audit_logger()
+    audit_log = _audit_logger_module.audit_log
+    audit_log_batch = _audit_logger_module.audit_log_batch
 except ImportError as e:
     print(f"Warning: Could not import audit_log: {e}")
     # Create a no-op decorator as fallback
@@ -19,28 +22,241 @@ except ImportError as e:
         def decorator(func):
             return func
         return decorator
+    audit_log_batch = audit_log
+
+class CampaignMutateBatch:
+    """Operations queued by CampaignManager methods and sent in one GoogleAdsService.mutate request
+    
+    Use as ``with manager.batch() as batch:`` and pass ``batch=batch`` to the create and targeting
+    methods; the request is sent when the block exits without an exception. Queued creates return
+    temporary resource names that later operations in the same batch can refer to. Afterwards
+    ``results`` lists every operation's resource name in order, and ``resource_names`` maps each
+    temporary name to the created resource. All operations succeed or fail together, so a batch
+    cannot be split across requests.
+    
+    Methods called with batch= write no audit record of their own; execute() records the whole
+    batch once, with the real resource names, after the request succeeds.
+    """
+    
+    def __init__(self, manager: "CampaignManager"):
+        self._manager = manager
+        self._operations = []
+        self._result_fields = []
+        self._temp_names = []
+        self._next_temp_id = -1
+        self.results: List[str] = []
+        self.resource_names: Dict[str, str] = {}
+    
+    def __enter__(self) -> "CampaignMutateBatch":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.execute()
+        return False
+    
+    def add(self, operation_field: str, operation: Any, collection: Optional[str] = None) -> Optional[str]:
+        """Queue a service operation as the MutateOperation field named operation_field
+        
+        When collection is given (e.g. "campaigns"), the operation's create is given a temporary
+        resource name in that collection, which is returned.
+        """
+        temp_name = None
+        if collection:
+            temp_name = f"customers/{self._manager.customer_id}/{collection}/{self._next_temp_id}"
+            self._next_temp_id -= 1
+            operation.create.resource_name = temp_name
+        
+        mutate_operation = self._manager._mutate_operation_type()
+        setattr(mutate_operation, operation_field, operation)
+        
+        self._operations.append(mutate_operation)
+        self._result_fields.append(operation_field.replace("_operation", "_result"))
+        self._temp_names.append(temp_name)
+        return temp_name
+    
+    @audit_log_batch("CREATE", "CAMPAIGN")
+    def execute(self) -> List[str]:
+        """Send the queued operations, returning their resource names in order"""
+        return self._send()
+    
+    def _send(self) -> List[str]:
+        """Send the queued operations without an audit record, for callers that audit themselves"""
+        operations = self._operations
+        if not operations:
+            return []
+        
+        manager = self._manager
+        try:
+            response = manager.base_client.get_google_ads_service().mutate(
+                customer_id=manager.customer_id,
+                mutate_operations=operations
+            )
+        except GoogleAdsException as ex:
+            raise manager.base_client.handle_exception(ex)
+        
+        results = [
+            getattr(operation_response, result_field).resource_name
+            for operation_response, result_field in zip(response.mutate_operation_responses, self._result_fields)
+        ]
+        self.resource_names.update(
+            (temp_name, resource_name)
+            for temp_name, resource_name in zip(self._temp_names, results)
+            if temp_name
+        )
+        self.results.extend(results)
+        
+        self._operations = []
+        self._result_fields = []
+        self._temp_names = []
+        return results
 
 class CampaignManager:
     """Manager for Google Ads campaign operations"""
     
+    # Most operations sent in one mutate request; larger batches are split
+    MAX_OPERATIONS_PER_REQUEST = 5000
+    
+    # Lookup queries for a single campaign, built once; format() fills in the campaign resource name
+    _CAMPAIGN_CRITERIA_QUERY = (
+        "SELECT campaign_criterion.resource_name, campaign_criterion.criterion_id, "
+        "campaign_criterion.location.geo_target_constant, campaign_criterion.language.language_constant, "
+        "campaign_criterion.type "
+        "FROM campaign_criterion "
+        "WHERE campaign_criterion.campaign = '{}' AND campaign_criterion.status = 'ENABLED'"
+    )
+    _CAMPAIGN_DETAILS_QUERY = (
+        "SELECT campaign.id, campaign.name, campaign.status, campaign.advertising_channel_type, "
+        "campaign_budget.amount_micros, campaign.start_date, campaign.end_date, "
+        "campaign.network_settings.target_google_search, campaign.network_settings.target_search_network, "
+        "campaign.network_settings.target_content_network, "
+        "campaign.network_settings.target_partner_search_network "
+        "FROM campaign "
+        "WHERE campaign.resource_name = '{}'"
+    )
+    # Update masks of the single-purpose update methods, built once; assigning one to an
+    # operation's update_mask copies it, so the constants are never modified
+    _STATUS_MASK = field_mask_pb2.FieldMask(paths=["status"])
+    _NAME_MASK = field_mask_pb2.FieldMask(paths=["name"])
+    _BUDGET_AMOUNT_MASK = field_mask_pb2.FieldMask(paths=["amount_micros"])
+    _NETWORK_SETTINGS_MASK = field_mask_pb2.FieldMask(paths=[
+        "network_settings.target_google_search",
+        "network_settings.target_search_network",
+        "network_settings.target_content_network",
+        "network_settings.target_partner_search_network",
+    ])
+    
+    # Complete listing queries with and without removed campaigns
+    _CAMPAIGNS_QUERY_ALL = (
+        "SELECT campaign.id, campaign.name, campaign.status, campaign.advertising_channel_type, "
+        "campaign_budget.amount_micros FROM campaign"
+    )
+    _CAMPAIGNS_QUERY_ACTIVE = f"{_CAMPAIGNS_QUERY_ALL} WHERE campaign.status != 'REMOVED'"
+    # Reads the listed campaign fields in one C-level call; applied to the campaign message
+    # rather than the row, since each "campaign.x" path would re-wrap row.campaign
+    _CAMPAIGN_FIELDS = operator.attrgetter("id", "name", "status", "advertising_channel_type")
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        
+        # Operation classes resolved once; get_type() does a registry lookup per call, while
+        # calling the class directly just builds the message
+        self._criterion_operation_type = type(self.client.get_type("CampaignCriterionOperation"))
+        self._campaign_operation_type = type(self.client.get_type("CampaignOperation"))
+        self._budget_operation_type = type(self.client.get_type("CampaignBudgetOperation"))
+        self._mutate_operation_type = type(self.client.get_type("MutateOperation"))
+        
+        enums = self.client.enums
+        self._campaign_status_enum = enums.CampaignStatusEnum
+        self._channel_type_enum = enums.AdvertisingChannelTypeEnum
+        self._budget_delivery_method_enum = enums.BudgetDeliveryMethodEnum
+        self._location_criterion_type = int(enums.CriterionTypeEnum.LOCATION)
+        self._language_criterion_type = int(enums.CriterionTypeEnum.LANGUAGE)
+        
+        # Bidding strategy name -> (enum value, campaign bidding scheme field, scheme message, scheme values)
+        bidding_strategy_type_enum = enums.BiddingStrategyTypeEnum
+        self._bidding_schemes = {
+            "MANUAL_CPC": (bidding_strategy_type_enum.MANUAL_CPC, "manual_cpc",
+                           type(self.client.get_type("ManualCpc")), {"enhanced_cpc_enabled": False}),
+            "MAXIMIZE_CONVERSIONS": (bidding_strategy_type_enum.MAXIMIZE_CONVERSIONS, "maximize_conversions",
+                                     type(self.client.get_type("MaximizeConversions")), {}),
+            "TARGET_CPA": (bidding_strategy_type_enum.TARGET_CPA, "target_cpa",
+                           type(self.client.get_type("TargetCpa")), {}),
+            "TARGET_ROAS": (bidding_strategy_type_enum.TARGET_ROAS, "target_roas",
+                            type(self.client.get_type("TargetRoas")), {}),
+        }
+    
+    def _mutate_campaign_criteria(self, operations: List[Any]) -> List[str]:
+        """Send campaign criterion operations in as few mutate requests as the per-request limit allows"""
+        campaign_criterion_service = self.base_client.get_campaign_criterion_service()
+        resource_names = []
+        
+        for start in range(0, len(operations), self.MAX_OPERATIONS_PER_REQUEST):
+            response = campaign_criterion_service.mutate_campaign_criteria(
+                customer_id=self.customer_id,
+                operations=operations[start:start + self.MAX_OPERATIONS_PER_REQUEST]
+            )
+            resource_names.extend(map(get_resource_name, response.results))
+        
+        return resource_names
+    
+    def batch(self) -> CampaignMutateBatch:
+        """Start a batch of operations sent together in one mutate request"""
+        return CampaignMutateBatch(self)
+    
+    def _budget_create_operation(self, budget_name: str, amount_micros: int, delivery_method: str = "STANDARD"):
+        """Build a CampaignBudgetOperation that creates a budget"""
+        budget_operation = self._budget_operation_type()
+        budget = budget_operation.create
+        
+        budget.name = budget_name
+        budget.amount_micros = amount_micros
+        budget.delivery_method = self._budget_delivery_method_enum[delivery_method]
+        
+        return budget_operation
+    
+    def _campaign_create_operation(self, campaign_name: str, budget_resource_name: str, campaign_type: str,
+                                   status: str, bidding_strategy_type: str):
+        """Build a CampaignOperation that creates a campaign"""
+        campaign_operation = self._campaign_operation_type()
+        self._populate_campaign(campaign_operation.create, campaign_name, budget_resource_name,
+                                campaign_type, status, bidding_strategy_type)
+        return campaign_operation
+    
+    def _criterion_create_operations(self, campaign_resource_name: str, criterion_field: str,
+                                     constant_field: str, constants: List[str]) -> List[Any]:
+        """Build CampaignCriterionOperations creating one criterion per constant resource name"""
+        criterion_operation_type = self._criterion_operation_type
+        operations = []
+        
+        for constant in constants:
+            criterion_operation = criterion_operation_type()
+            criterion = criterion_operation.create
+            
+            criterion.campaign = campaign_resource_name
+            setattr(getattr(criterion, criterion_field), constant_field, constant)
+            
+            operations.append(criterion_operation)
+        
+        return operations
     
     @audit_log("CREATE", "BUDGET")
-    def create_campaign_budget(self, budget_name: str, amount_micros: int, delivery_method: str = "STANDARD") -> Optional[str]:
-        """Create a campaign budget"""
+    @invalidates_query_cache
+    def create_campaign_budget(self, budget_name: str, amount_micros: int, delivery_method: str = "STANDARD",
+                               *, batch: Optional[CampaignMutateBatch] = None) -> Optional[str]:
+        """Create a campaign budget
+        
+        With batch, the create is queued and the budget's temporary resource name is returned;
+        the create is audited when the batch is sent.
+        """
         try:
-            budget_service = self.base_client.get_campaign_budget_service()
-            
-            budget_operation = self.client.get_type("CampaignBudgetOperation")
-            budget = budget_operation.create
-            
-            budget.name = budget_name
-            budget.amount_micros = amount_micros
-            budget.delivery_method = self.client.enums.BudgetDeliveryMethodEnum[delivery_method]
+            budget_operation = self._budget_create_operation(budget_name, amount_micros, delivery_method)
+            if batch is not None:
+                return batch.add("campaign_budget_operation", budget_operation, "campaignBudgets")
             
+            budget_service = self.base_client.get_campaign_budget_service()
             response = budget_service.mutate_campaign_budgets(
                 customer_id=self.customer_id,
                 operations=[budget_operation]
@@ -52,40 +268,24 @@ class CampaignManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("CREATE", "CAMPAIGN")
+    @invalidates_query_cache
     def create_campaign(self, campaign_name: str, budget_resource_name: str, campaign_type: str = "SEARCH",
-                       status: str = "PAUSED", bidding_strategy_type: str = "MANUAL_CPC") -> Optional[str]:
-        """Create a campaign"""
+                       status: str = "PAUSED", bidding_strategy_type: str = "MANUAL_CPC",
+                       *, batch: Optional[CampaignMutateBatch] = None) -> Optional[str]:
+        """Create a campaign
+        
+        With batch, the create is queued and the campaign's temporary resource name is returned;
+        budget_resource_name may then be a budget's temporary name from the same batch. The
+        create is audited when the batch is sent.
+        """
         try:
-            campaign_service = self.base_client.get_campaign_service()
-            
-            campaign_operation = self.client.get_type("CampaignOperation")
-            campaign = campaign_operation.create
-            
-            campaign.name = campaign_name
-            campaign.campaign_budget = budget_resource_name
-            campaign.advertising_channel_type = self.client.enums.AdvertisingChannelTypeEnum[campaign_type]
-            campaign.status = self.client.enums.CampaignStatusEnum[status]
-            
-            # Set bidding strategy
-            if bidding_strategy_type == "MANUAL_CPC":
-                campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.MANUAL_CPC
-                campaign.manual_cpc.enhanced_cpc_enabled = False
-            elif bidding_strategy_type == "MAXIMIZE_CONVERSIONS":
-                campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.MAXIMIZE_CONVERSIONS
-                campaign.maximize_conversions = self.client.get_type("MaximizeConversions")
-            elif bidding_strategy_type == "TARGET_CPA":
-                campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.TARGET_CPA
-                campaign.target_cpa = self.client.get_type("TargetCpa")
-            elif bidding_strategy_type == "TARGET_ROAS":
-                campaign.bidding_strategy_type = self.client.enums.BiddingStrategyTypeEnum.TARGET_ROAS
-                campaign.target_roas = self.client.get_type("TargetRoas")
-            
-            # Set network settings
-            campaign.network_settings.target_google_search = True
-            campaign.network_settings.target_search_network = True
-            campaign.network_settings.target_content_network = False
-            campaign.network_settings.target_partner_search_network = False
+            campaign_operation = self._campaign_create_operation(
+                campaign_name, budget_resource_name, campaign_type, status, bidding_strategy_type
+            )
+            if batch is not None:
+                return batch.add("campaign_operation", campaign_operation, "campaigns")
             
+            campaign_service = self.base_client.get_campaign_service()
             response = campaign_service.mutate_campaigns(
                 customer_id=self.customer_id,
                 operations=[campaign_operation]
@@ -96,52 +296,111 @@ class CampaignManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def add_geo_targeting(self, campaign_resource_name: str, location_ids: List[str]) -> Optional[List[str]]:
-        """Add geographic targeting to a campaign"""
+    def _populate_campaign(self, campaign, campaign_name: str, budget_resource_name: str,
+                           campaign_type: str, status: str, bidding_strategy_type: str):
+        """Fill in a new campaign's name, budget, type, status, bidding and network settings"""
+        campaign.name = campaign_name
+        campaign.campaign_budget = budget_resource_name
+        campaign.advertising_channel_type = self._channel_type_enum[campaign_type]
+        campaign.status = self._campaign_status_enum[status]
+        
+        # Set bidding strategy
+        bidding_scheme = self._bidding_schemes.get(bidding_strategy_type)
+        if bidding_scheme:
+            strategy_type, scheme_field, scheme_type, scheme_values = bidding_scheme
+            campaign.bidding_strategy_type = strategy_type
+            setattr(campaign, scheme_field, scheme_type(**scheme_values))
+        
+        # Set network settings
+        campaign.network_settings.target_google_search = True
+        campaign.network_settings.target_search_network = True
+        campaign.network_settings.target_content_network = False
+        campaign.network_settings.target_partner_search_network = False
+    
+    @audit_log("CREATE", "CAMPAIGN")
+    @invalidates_query_cache
+    def create_campaign_with_budget(self, campaign_name: str, budget_name: str, amount_micros: int,
+                                    campaign_type: str = "SEARCH", status: str = "PAUSED",
+                                    bidding_strategy_type: str = "MANUAL_CPC",
+                                    location_ids: Optional[List[str]] = None,
+                                    delivery_method: str = "STANDARD") -> Dict[str, Any]:
+        """Create a budget, a campaign using it and optional geo targeting in one mutate request
+        
+        The campaign refers to the new budget, and the geo criteria to the new campaign,
+        through temporary resource names resolved by the API within the request.
+        """
         try:
-            campaign_criterion_service = self.base_client.get_campaign_criterion_service()
-            operations = []
-            
-            for location_id in location_ids:
-                criterion_operation = self.client.get_type("CampaignCriterionOperation")
-                criterion = criterion_operation.create
-                
-                criterion.campaign = campaign_resource_name
-                criterion.location.geo_target_constant = f"geoTargetConstants/{location_id}"
-                
-                operations.append(criterion_operation)
+            batch = self.batch()
             
-            response = campaign_criterion_service.mutate_campaign_criteria(
-                customer_id=self.customer_id,
-                operations=operations
+            budget_temp_name = batch.add(
+                "campaign_budget_operation",
+                self._budget_create_operation(budget_name, amount_micros, delivery_method),
+                "campaignBudgets"
             )
-            
-            return [result.resource_name for result in response.results]
+            campaign_temp_name = batch.add(
+                "campaign_operation",
+                self._campaign_create_operation(campaign_name, budget_temp_name, campaign_type,
+                                                status, bidding_strategy_type),
+                "campaigns"
+            )
+            for criterion_operation in self._criterion_create_operations(
+                campaign_temp_name, "location", "geo_target_constant",
+                [f"geoTargetConstants/{location_id}" for location_id in location_ids or []]
+            ):
+                batch.add("campaign_criterion_operation", criterion_operation)
+            
+            # This method's own audit record covers the request
+            results = batch._send()
+            return {
+                'budget_resource_name': results[0],
+                'campaign_resource_name': results[1],
+                'geo_criteria': results[2:]
+            }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def add_language_targeting(self, campaign_resource_name: str, language_codes: List[str]) -> Optional[List[str]]:
-        """Add language targeting to a campaign"""
+    @invalidates_query_cache
+    def add_geo_targeting(self, campaign_resource_name: str, location_ids: List[str],
+                          *, batch: Optional[CampaignMutateBatch] = None) -> Optional[List[str]]:
+        """Add geographic targeting to a campaign
+        
+        With batch, the criteria are queued and None is returned; campaign_resource_name may
+        then be a campaign's temporary name from the same batch.
+        """
         try:
-            campaign_criterion_service = self.base_client.get_campaign_criterion_service()
-            operations = []
+            operations = self._criterion_create_operations(
+                campaign_resource_name, "location", "geo_target_constant",
+                [f"geoTargetConstants/{location_id}" for location_id in location_ids]
+            )
+            if batch is not None:
+                for operation in operations:
+                    batch.add("campaign_criterion_operation", operation)
+                return None
             
-            for language_code in language_codes:
-                criterion_operation = self.client.get_type("CampaignCriterionOperation")
-                criterion = criterion_operation.create
-                
-                criterion.campaign = campaign_resource_name
-                criterion.language.language_constant = f"languageConstants/{language_code}"
-                
-                operations.append(criterion_operation)
+            return self._mutate_campaign_criteria(operations)
             
-            response = campaign_criterion_service.mutate_campaign_criteria(
-                customer_id=self.customer_id,
-                operations=operations
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @invalidates_query_cache
+    def add_language_targeting(self, campaign_resource_name: str, language_codes: List[str],
+                               *, batch: Optional[CampaignMutateBatch] = None) -> Optional[List[str]]:
+        """Add language targeting to a campaign
+        
+        With batch, the criteria are queued and None is returned, as with add_geo_targeting.
+        """
+        try:
+            operations = self._criterion_create_operations(
+                campaign_resource_name, "language", "language_constant",
+                [f"languageConstants/{language_code}" for language_code in language_codes]
             )
+            if batch is not None:
+                for operation in operations:
+                    batch.add("campaign_criterion_operation", operation)
+                return None
             
-            return [result.resource_name for result in response.results]
+            return self._mutate_campaign_criteria(operations)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
@@ -149,44 +408,36 @@ class CampaignManager:
     def get_campaign_criteria(self, campaign_resource_name: str) -> Dict[str, List[Dict]]:
         """Retrieve all targeting criteria for a campaign"""
         try:
-            googleads_service = self.base_client.get_google_ads_service()
+            query = self._CAMPAIGN_CRITERIA_QUERY.format(campaign_resource_name)
             
-            query = f"""
-                SELECT 
-                    campaign_criterion.resource_name,
-                    campaign_criterion.criterion_id,
-                    campaign_criterion.location.geo_target_constant,
-                    campaign_criterion.language.language_constant,
-                    campaign_criterion.type
-                FROM campaign_criterion 
-                WHERE campaign_criterion.campaign = '{campaign_resource_name}'
-                AND campaign_criterion.status = 'ENABLED'
-            """
-            
-            response = googleads_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
             geo_targets = []
             language_targets = []
+            geo_targets_append = geo_targets.append
+            language_targets_append = language_targets.append
+            location_type = self._location_criterion_type
+            language_type = self._language_criterion_type
             
-            for row in response:
+            for row in rows:
                 criterion = row.campaign_criterion
-                if criterion.type.name == "LOCATION":
+                # Compared by enum value rather than name to skip the per-row name lookup
+                criterion_type = criterion.type_
+                if criterion_type == location_type:
                     geo_constant = criterion.location.geo_target_constant
                     if geo_constant:
-                        geo_id = geo_constant.split('/')[-1]
-                        geo_targets.append({
+                        geo_targets_append({
                             'resource_name': criterion.resource_name,
                             'geo_target_constant': geo_constant,
-                            'location_id': geo_id
+                            'location_id': geo_constant.rpartition('/')[2]
                         })
-                elif criterion.type.name == "LANGUAGE":
+                elif criterion_type == language_type:
                     lang_constant = criterion.language.language_constant
                     if lang_constant:
-                        lang_code = lang_constant.split('/')[-1]
-                        language_targets.append({
+                        language_targets_append({
                             'resource_name': criterion.resource_name,
                             'language_constant': lang_constant,
-                            'language_code': lang_code
+                            'language_code': lang_constant.rpartition('/')[2]
                         })
             
             return {
@@ -197,22 +448,20 @@ class CampaignManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    @invalidates_query_cache
     def remove_campaign_criteria(self, criterion_resource_names: List[str]) -> bool:
         """Remove specific campaign criteria"""
         try:
-            campaign_criterion_service = self.base_client.get_campaign_criterion_service()
+            criterion_operation_type = self._criterion_operation_type
             operations = []
             
             for resource_name in criterion_resource_names:
-                operation = self.client.get_type("CampaignCriterionOperation")
+                operation = criterion_operation_type()
                 operation.remove = resource_name
                 operations.append(operation)
             
             if operations:
-                response = campaign_criterion_service.mutate_campaign_criteria(
-                    customer_id=self.customer_id,
-                    operations=operations
-                )
+                self._mutate_campaign_criteria(operations)
                 return True
             
             return False
@@ -221,19 +470,19 @@ class CampaignManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "CAMPAIGN")
+    @invalidates_query_cache
     def update_campaign_status(self, campaign_resource_name: str, status: str) -> Optional[str]:
         """Update campaign status"""
         try:
             campaign_service = self.base_client.get_campaign_service()
             
-            campaign_operation = self.client.get_type("CampaignOperation")
+            campaign_operation = self._campaign_operation_type()
             campaign = campaign_operation.update
             
             campaign.resource_name = campaign_resource_name
-            campaign.status = self.client.enums.CampaignStatusEnum[status]
+            campaign.status = self._campaign_status_enum[status]
             
-            campaign_operation.update_mask = field_mask_pb2.FieldMask()
-            campaign_operation.update_mask.paths.append("status")
+            campaign_operation.update_mask = self._STATUS_MASK
             
             response = campaign_service.mutate_campaigns(
                 customer_id=self.customer_id,
@@ -246,12 +495,13 @@ class CampaignManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("REMOVE", "CAMPAIGN")
+    @invalidates_query_cache
     def remove_campaign(self, campaign_resource_name: str) -> Optional[str]:
         """Remove a campaign"""
         try:
             campaign_service = self.base_client.get_campaign_service()
             
-            campaign_operation = self.client.get_type("CampaignOperation")
+            campaign_operation = self._campaign_operation_type()
             campaign_operation.remove = campaign_resource_name
             
             response = campaign_service.mutate_campaigns(
@@ -267,35 +517,23 @@ class CampaignManager:
     def list_campaigns(self, include_removed: bool = False) -> List[Dict[str, Any]]:
         """List all campaigns"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    campaign.advertising_channel_type,
-                    campaign_budget.amount_micros
-                FROM campaign
-            """
+            query = self._CAMPAIGNS_QUERY_ALL if include_removed else self._CAMPAIGNS_QUERY_ACTIVE
             
-            if not include_removed:
-                query += " WHERE campaign.status != 'REMOVED'"
-            
-            response = ga_service.search(
-                customer_id=self.customer_id,
-                query=query
-            )
+            rows = self.base_client.search_stream_rows(query)
             
             campaigns = []
-            for row in response:
-                campaigns.append({
-                    'id': row.campaign.id,
-                    'name': row.campaign.name,
-                    'status': row.campaign.status.name,
-                    'type': row.campaign.advertising_channel_type.name,
+            campaigns_append = campaigns.append
+            campaign_fields = self._CAMPAIGN_FIELDS
+            resource_prefix = f"customers/{self.customer_id}/campaigns/"
+            for row in rows:
+                campaign_id, name, status, channel_type = campaign_fields(row.campaign)
+                campaigns_append({
+                    'id': campaign_id,
+                    'name': name,
+                    'status': status.name,
+                    'type': channel_type.name,
                     'budget_micros': row.campaign_budget.amount_micros,
-                    'resource_name': f"customers/{self.customer_id}/campaigns/{row.campaign.id}"
+                    'resource_name': f"{resource_prefix}{campaign_id}"
                 })
             
             return campaigns
@@ -303,27 +541,44 @@ class CampaignManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    def list_campaign_columns(self, include_removed: bool = False) -> Dict[str, List[Any]]:
+        """List all campaigns as parallel columns keyed like list_campaigns rows
+        
+        Avoids a dict per campaign; the result can be passed straight to pandas.DataFrame.
+        """
+        try:
+            query = self._CAMPAIGNS_QUERY_ALL if include_removed else self._CAMPAIGNS_QUERY_ACTIVE
+            
+            rows = self.base_client.search_stream_rows(query)
+            
+            ids, names, statuses, types, budgets = [], [], [], [], []
+            for row in rows:
+                campaign = row.campaign
+                ids.append(campaign.id)
+                names.append(campaign.name)
+                statuses.append(campaign.status.name)
+                types.append(campaign.advertising_channel_type.name)
+                budgets.append(row.campaign_budget.amount_micros)
+            
+            resource_prefix = f"customers/{self.customer_id}/campaigns/"
+            return {
+                'id': ids,
+                'name': names,
+                'status': statuses,
+                'type': types,
+                'budget_micros': budgets,
+                'resource_name': [f"{resource_prefix}{campaign_id}" for campaign_id in ids]
+            }
+            
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
     def get_campaign_details(self, campaign_resource_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed campaign information"""
         try:
             ga_service = self.base_client.get_google_ads_service()
             
-            query = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    campaign.advertising_channel_type,
-                    campaign_budget.amount_micros,
-                    campaign.start_date,
-                    campaign.end_date,
-                    campaign.network_settings.target_google_search,
-                    campaign.network_settings.target_search_network,
-                    campaign.network_settings.target_content_network,
-                    campaign.network_settings.target_partner_search_network
-                FROM campaign
-                WHERE campaign.resource_name = '{campaign_resource_name}'
-            """
+            query = self._CAMPAIGN_DETAILS_QUERY.format(campaign_resource_name)
             
             response = ga_service.search(
                 customer_id=self.customer_id,
@@ -351,19 +606,19 @@ class CampaignManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "CAMPAIGN")
+    @invalidates_query_cache
     def update_campaign_name(self, campaign_resource_name: str, new_name: str) -> Optional[str]:
         """Update campaign name"""
         try:
             campaign_service = self.base_client.get_campaign_service()
             
-            campaign_operation = self.client.get_type("CampaignOperation")
+            campaign_operation = self._campaign_operation_type()
             campaign = campaign_operation.update
             
             campaign.resource_name = campaign_resource_name
             campaign.name = new_name
             
-            campaign_operation.update_mask = field_mask_pb2.FieldMask()
-            campaign_operation.update_mask.paths.append("name")
+            campaign_operation.update_mask = self._NAME_MASK
             
             response = campaign_service.mutate_campaigns(
                 customer_id=self.customer_id,
@@ -376,15 +631,11 @@ class CampaignManager:
             raise self.base_client.handle_exception(ex)
     
     @audit_log("UPDATE", "BUDGET")
+    @invalidates_query_cache
     def update_campaign_budget(self, campaign_resource_name: str, new_budget_micros: int) -> Optional[str]:
         """Update campaign budget"""
         try:
-            # First get the campaign's budget resource name
-            campaign_details = self.get_campaign_details(campaign_resource_name)
-            if not campaign_details:
-                raise ValidationError("Could not retrieve campaign details")
-            
-            # Get the budget resource name
+            # Get the budget resource name; no row also means the campaign does not exist
             ga_service = self.base_client.get_google_ads_service()
             query = f"""
                 SELECT campaign_budget.resource_name
@@ -393,25 +644,24 @@ class CampaignManager:
             """
             
             response = ga_service.search(customer_id=self.customer_id, query=query)
-            budget_resource_name = None
-            for row in response:
-                budget_resource_name = row.campaign_budget.resource_name
-                break
+            row = next(iter(response), None)
+            if row is None:
+                raise ValidationError("Could not retrieve campaign details")
             
+            budget_resource_name = row.campaign_budget.resource_name
             if not budget_resource_name:
                 raise ValidationError("Could not find campaign budget")
             
             # Update the budget
             budget_service = self.base_client.get_campaign_budget_service()
             
-            budget_operation = self.client.get_type("CampaignBudgetOperation")
+            budget_operation = self._budget_operation_type()
             budget = budget_operation.update
             
             budget.resource_name = budget_resource_name
             budget.amount_micros = new_budget_micros
             
-            budget_operation.update_mask = field_mask_pb2.FieldMask()
-            budget_operation.update_mask.paths.append("amount_micros")
+            budget_operation.update_mask = self._BUDGET_AMOUNT_MASK
             
             response = budget_service.mutate_campaign_budgets(
                 customer_id=self.customer_id,
@@ -423,25 +673,31 @@ class CampaignManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    async def aget_campaign_details(self, campaign_resource_name: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_campaign_details."""
+        return await asyncio.to_thread(bind_audit_identity(self.get_campaign_details), campaign_resource_name)
+    
+    async def aupdate_campaign_budget(self, campaign_resource_name: str, new_budget_micros: int) -> Optional[str]:
+        """Async variant of update_campaign_budget."""
+        return await asyncio.to_thread(bind_audit_identity(self.update_campaign_budget), campaign_resource_name, new_budget_micros)
+    
+    @invalidates_query_cache
     def update_campaign_network_settings(self, campaign_resource_name: str, network_settings: Dict[str, bool]) -> Optional[str]:
         """Update campaign network settings"""
         try:
             campaign_service = self.base_client.get_campaign_service()
             
-            campaign_operation = self.client.get_type("CampaignOperation")
+            campaign_operation = self._campaign_operation_type()
             campaign = campaign_operation.update
             
             campaign.resource_name = campaign_resource_name
-            campaign.network_settings.target_google_search = network_settings.get('target_google_search', True)
-            campaign.network_settings.target_search_network = network_settings.get('target_search_network', True)
-            campaign.network_settings.target_content_network = network_settings.get('target_content_network', False)
-            campaign.network_settings.target_partner_search_network = network_settings.get('target_partner_search_network', False)
-            
-            campaign_operation.update_mask = field_mask_pb2.FieldMask()
-            campaign_operation.update_mask.paths.append("network_settings.target_google_search")
-            campaign_operation.update_mask.paths.append("network_settings.target_search_network")
-            campaign_operation.update_mask.paths.append("network_settings.target_content_network")
-            campaign_operation.update_mask.paths.append("network_settings.target_partner_search_network")
+            campaign_network_settings = campaign.network_settings
+            campaign_network_settings.target_google_search = network_settings.get('target_google_search', True)
+            campaign_network_settings.target_search_network = network_settings.get('target_search_network', True)
+            campaign_network_settings.target_content_network = network_settings.get('target_content_network', False)
+            campaign_network_settings.target_partner_search_network = network_settings.get('target_partner_search_network', False)
+            
+            campaign_operation.update_mask = self._NETWORK_SETTINGS_MASK
             
             response = campaign_service.mutate_campaigns(
                 customer_id=self.customer_id,
@@ -3,7 +3,7 @@
 from typing import Optional, List, Dict, Any
 from google.ads.googleads.errors import GoogleAdsException
 from google.protobuf import field_mask_pb2
-from ..core.base_client import BaseGoogleAdsClient
+from ..core.base_client import BaseGoogleAdsClient, get_resource_name
 from ..core.exceptions import APIError, ValidationError
 
 class ConversionManager:
@@ -111,6 +111,42 @@ class ConversionManager:
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    def bulk_update_statuses(self, statuses: Dict[str, str]) -> List[str]:
+        """Update the status of several conversion actions in a single mutate request
+        
+        Args:
+            statuses: Mapping of conversion action resource name to new status
+        """
+        if not statuses:
+            return []
+        
+        try:
+            conversion_action_service = self.base_client.get_conversion_action_service()
+            operations = []
+            
+            for conversion_resource_name, status in statuses.items():
+                conversion_action_operation = self.client.get_type("ConversionActionOperation")
+                conversion_action = conversion_action_operation.update
+                
+                conversion_action.resource_name = conversion_resource_name
+                conversion_action.status = self.client.enums.ConversionActionStatusEnum[status]
+                
+                field_mask = field_mask_pb2.FieldMask()
+                field_mask.paths.append("status")
+                conversion_action_operation.update_mask = field_mask
+                
+                operations.append(conversion_action_operation)
+            
+            response = conversion_action_service.mutate_conversion_actions(
+                customer_id=self.customer_id,
+                operations=operations
+            )
+            
+            return list(map(get_resource_name, response.results))
+            
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
     def get_conversion_tracking_status(self) -> Dict[str, Any]:
         """Get conversion tracking status"""
         try:
@@ -1,16 +1,17 @@
 """Ad extensions management functionality"""
 
-from typing import Optional, List, Dict, Any
+import operator
+from typing import Optional, List, Dict, Any, Tuple
 from google.ads.googleads.errors import GoogleAdsException
-from ..core.base_client import BaseGoogleAdsClient
+from ..core.audit import import_audit_logger
+from ..core.base_client import BaseGoogleAdsClient, get_resource_name
 from ..core.exceptions import APIError, ValidationError
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_log
+    _audit_logger_module = import_audit_logger()
+    audit_log = _audit_logger_module.audit_log
+    audit_log_batch = _audit_logger_module.audit_log_batch
 except ImportError as e:
     print(f"Warning: Could not import audit_log: {e}")
     # Create a no-op decorator as fallback
@@ -18,32 +19,97 @@ except ImportError as e:
         def decorator(func):
             return func
         return decorator
+    audit_log_batch = audit_log
 
 class ExtensionsManager:
     """Manager for Google Ads extensions operations"""
     
+    # Most operations sent in one mutate request; larger batches are split
+    MAX_OPERATIONS_PER_REQUEST = 5000
+    
+    # Reads an asset's ID and type in one C-level call
+    _ASSET_FIELDS = operator.attrgetter("id", "type_")
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        
+        # Resolved once; get_type() does a registry lookup per call
+        self._asset_operation_type = type(self.client.get_type("AssetOperation"))
+    
+    def _callout_asset_operation(self, callout_text: str):
+        """Build an AssetOperation that creates a callout asset"""
+        asset_operation = self._asset_operation_type()
+        asset_operation.create.callout_asset.callout_text = callout_text
+        return asset_operation
+    
+    def _sitelink_asset_operation(self, link_text: str, final_url: str, description1: Optional[str] = None,
+                                  description2: Optional[str] = None):
+        """Build an AssetOperation that creates a sitelink asset"""
+        asset_operation = self._asset_operation_type()
+        sitelink_asset = asset_operation.create.sitelink_asset
+        
+        sitelink_asset.link_text = link_text
+        sitelink_asset.final_urls.append(final_url)
+        
+        if description1:
+            sitelink_asset.description1 = description1
+        if description2:
+            sitelink_asset.description2 = description2
+        
+        return asset_operation
+    
+    def _mutate_assets(self, operations: List[Any],
+                       partial_failure: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Send asset operations in as few mutate requests as the per-request limit allows
+        
+        Returns:
+            Resource names in input order (empty strings for rejected operations), and the
+            per-operation errors reported under partial failure, indexed into ``operations``
+        """
+        asset_service = self.base_client.get_asset_service()
+        resource_names = []
+        failures = []
+        
+        for start in range(0, len(operations), self.MAX_OPERATIONS_PER_REQUEST):
+            # partial_failure is not a flattened argument, so it needs a full request object
+            request = self.client.get_type("MutateAssetsRequest")
+            request.customer_id = self.customer_id
+            request.operations = operations[start:start + self.MAX_OPERATIONS_PER_REQUEST]
+            request.partial_failure = partial_failure
+            
+            response = asset_service.mutate_assets(request=request)
+            resource_names.extend(map(get_resource_name, response.results))
+            if partial_failure:
+                failures.extend(self.base_client.partial_failure_errors(response, index_offset=start))
+        
+        return resource_names, failures
     
     @audit_log("CREATE", "EXTENSION")
     def create_callout_extension(self, callout_text: str) -> Optional[str]:
         """Create a callout extension"""
         try:
-            asset_service = self.base_client.get_asset_service()
-            
-            asset_operation = self.client.get_type("AssetOperation")
-            asset = asset_operation.create
+            resource_names, _ = self._mutate_assets([self._callout_asset_operation(callout_text)])
+            return resource_names[0]
             
-            asset.callout_asset.callout_text = callout_text
-            
-            response = asset_service.mutate_assets(
-                customer_id=self.customer_id,
-                operations=[asset_operation]
-            )
-            
-            return response.results[0].resource_name
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("CREATE", "EXTENSION")
+    def create_callout_extensions(self, callout_texts: List[str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Create several callout extensions with as few mutate requests as possible
+        
+        Returns:
+            Resource names in input order (empty strings for rejected entries), and one error
+            dict per rejected entry with its ``index`` in ``callout_texts`` so only those can be retried
+        """
+        if not callout_texts:
+            return [], []
+        
+        try:
+            operations = [self._callout_asset_operation(callout_text) for callout_text in callout_texts]
+            return self._mutate_assets(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
@@ -52,25 +118,29 @@ class ExtensionsManager:
     def create_sitelink_extension(self, link_text: str, final_url: str, description1: Optional[str] = None, description2: Optional[str] = None) -> Optional[str]:
         """Create a sitelink extension"""
         try:
-            asset_service = self.base_client.get_asset_service()
-            
-            asset_operation = self.client.get_type("AssetOperation")
-            asset = asset_operation.create
-            
-            asset.sitelink_asset.link_text = link_text
-            asset.sitelink_asset.final_urls.append(final_url)
-            
-            if description1:
-                asset.sitelink_asset.description1 = description1
-            if description2:
-                asset.sitelink_asset.description2 = description2
-            
-            response = asset_service.mutate_assets(
-                customer_id=self.customer_id,
-                operations=[asset_operation]
-            )
+            operation = self._sitelink_asset_operation(link_text, final_url, description1, description2)
+            resource_names, _ = self._mutate_assets([operation])
+            return resource_names[0]
             
-            return response.results[0].resource_name
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("CREATE", "EXTENSION")
+    def create_sitelink_extensions(self, specs: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Create several sitelink extensions with as few mutate requests as possible
+        
+        Args:
+            specs: One dict per sitelink with create_sitelink_extension's keyword arguments
+        
+        Returns:
+            Resource names and the rejected entries' errors, as create_callout_extensions
+        """
+        if not specs:
+            return [], []
+        
+        try:
+            operations = [self._sitelink_asset_operation(**spec) for spec in specs]
+            return self._mutate_assets(operations, partial_failure=True)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
@@ -143,19 +213,25 @@ class ExtensionsManager:
             response = ga_service.search(customer_id=self.customer_id, query=query)
             
             extensions = []
+            extensions_append = extensions.append
+            asset_fields = self._ASSET_FIELDS
+            resource_prefix = f"customers/{self.customer_id}/assets/"
             for row in response:
+                asset = row.asset
+                asset_id, asset_type = asset_fields(asset)
+                type_name = asset_type.name
                 extension_data = {
-                    'id': row.asset.id,
-                    'type': row.asset.type_.name,
-                    'resource_name': f"customers/{self.customer_id}/assets/{row.asset.id}"
+                    'id': asset_id,
+                    'type': type_name,
+                    'resource_name': f"{resource_prefix}{asset_id}"
                 }
                 
-                if row.asset.type_.name == 'CALLOUT':
-                    extension_data['text'] = row.asset.callout_asset.callout_text
-                elif row.asset.type_.name == 'SITELINK':
-                    extension_data['text'] = row.asset.sitelink_asset.link_text
+                if type_name == 'CALLOUT':
+                    extension_data['text'] = asset.callout_asset.callout_text
+                elif type_name == 'SITELINK':
+                    extension_data['text'] = asset.sitelink_asset.link_text
                 
-                extensions.append(extension_data)
+                extensions_append(extension_data)
             
             return extensions
             
@@ -1,17 +1,19 @@
 """Keyword management functionality"""
 
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from google.ads.googleads.errors import GoogleAdsException
 from google.protobuf import field_mask_pb2
-from ..core.base_client import BaseGoogleAdsClient
-from ..core.exceptions import APIError, ValidationError
+from ..core.audit import import_audit_logger
+from ..core.base_client import BaseGoogleAdsClient, get_resource_name
+from ..core.query_cache import cached_query
+from ..core.exceptions import APIError, BatchJobTimeoutError, PartialFailureError, ValidationError
 
-# Import audit logger from the project root
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Load the audit logger from the project root without touching sys.path
 try:
-    from audit_logger import audit_log
+    _audit_logger_module = import_audit_logger()
+    audit_log = _audit_logger_module.audit_log
+    audit_log_batch = _audit_logger_module.audit_log_batch
 except ImportError as e:
     print(f"Warning: Could not import audit_log: {e}")
     # Create a no-op decorator as fallback
@@ -19,69 +21,261 @@ except ImportError as e:
         def decorator(func):
             return func
         return decorator
+    audit_log_batch = audit_log
 
 class KeywordManager:
     """Manager for Google Ads keyword operations"""
     
+    # Seconds a keyword listing or performance result is served from memory
+    QUERY_CACHE_TTL = 60.0
+    
+    # add_keywords hands lists at least this long to a batch job instead of one mutate
+    BATCH_JOB_THRESHOLD = 1000
+    # Operations uploaded per AddBatchJobOperations call
+    BATCH_JOB_UPLOAD_CHUNK_SIZE = 2000
+    # Seconds between batch job status checks, doubling up to the maximum
+    BATCH_JOB_POLL_INITIAL_DELAY = 1.0
+    BATCH_JOB_POLL_MAX_DELAY = 30.0
+    # Seconds to wait for a batch job before giving up
+    BATCH_JOB_TIMEOUT = 900.0
+    
+    # Listing and report queries, built once. list_keywords appends its ad group filter;
+    # the performance query is formatted with the GAQL date range
+    _KEYWORDS_QUERY_ALL = (
+        "SELECT ad_group_criterion.criterion_id, ad_group_criterion.keyword.text, "
+        "ad_group_criterion.keyword.match_type, ad_group_criterion.status, "
+        "ad_group_criterion.cpc_bid_micros, ad_group_criterion.quality_info.quality_score, "
+        "ad_group.id, ad_group.name, campaign.id, campaign.name "
+        "FROM ad_group_criterion "
+        "WHERE ad_group_criterion.type = 'KEYWORD'"
+    )
+    _KEYWORDS_QUERY_ACTIVE = f"{_KEYWORDS_QUERY_ALL} AND ad_group_criterion.status != 'REMOVED'"
+    _CAMPAIGN_NEGATIVE_KEYWORDS_QUERY = (
+        "SELECT campaign_criterion.criterion_id, campaign_criterion.keyword.text, "
+        "campaign_criterion.keyword.match_type, campaign.id, campaign.name "
+        "FROM campaign_criterion "
+        "WHERE campaign_criterion.type = 'KEYWORD' "
+        "AND campaign_criterion.negative = TRUE"
+    )
+    _KEYWORD_PERFORMANCE_QUERY = (
+        "SELECT ad_group_criterion.keyword.text, ad_group_criterion.keyword.match_type, "
+        "ad_group.name, campaign.name, metrics.clicks, metrics.impressions, metrics.cost_micros, "
+        "metrics.conversions, metrics.ctr, metrics.average_cpc, metrics.cost_per_conversion "
+        "FROM keyword_view "
+        "WHERE segments.date DURING {date_range} "
+        "AND ad_group_criterion.status = 'ENABLED'"
+    )
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        self._query_cache = client.query_cache
+        
+        # Resolved once here rather than per keyword in the builder loops
+        self._criterion_operation_type = type(self.client.get_type("AdGroupCriterionOperation"))
+        self._campaign_criterion_operation_type = type(self.client.get_type("CampaignCriterionOperation"))
+        self._mutate_operation_type = type(self.client.get_type("MutateOperation"))
+        self._criterion_status_enum = self.client.enums.AdGroupCriterionStatusEnum
+        self._match_type_enum = self.client.enums.KeywordMatchTypeEnum
+    
+    def invalidate_query_cache(self) -> None:
+        """Drop cached query results, this manager's and those of the others on its client"""
+        self.base_client.invalidate_query_cache()
+    
+    def _populate_keyword(self, ad_group_criterion: Any, ad_group_resource_name: str, keyword_data: Dict[str, Any]) -> None:
+        """Fill a new AdGroupCriterion for one entry of add_keywords' keywords_data"""
+        ad_group_criterion.ad_group = ad_group_resource_name
+        ad_group_criterion.status = self._criterion_status_enum[keyword_data.get('status', 'ENABLED')]
+        
+        # Set keyword and match type
+        ad_group_criterion.keyword.text = keyword_data['text']
+        ad_group_criterion.keyword.match_type = self._match_type_enum[keyword_data.get('match_type', 'BROAD')]
+        
+        # Set CPC bid if provided
+        if 'cpc_bid_micros' in keyword_data and keyword_data['cpc_bid_micros']:
+            ad_group_criterion.cpc_bid_micros = keyword_data['cpc_bid_micros']
     
     @audit_log("CREATE", "KEYWORD")
     def add_keywords(self, ad_group_resource_name: str, keywords_data: List[Dict[str, Any]]) -> List[str]:
-        """Add multiple keywords to an ad group"""
+        """Add multiple keywords to an ad group
+        
+        Shorter lists are added in one atomic mutate: all keywords or none. Lists of
+        BATCH_JOB_THRESHOLD keywords or more go through a batch job, as add_keywords_bulk
+        does. That path is not atomic, and the call blocks until the job has finished,
+        which can take up to BATCH_JOB_TIMEOUT (15 minutes). Called from a Streamlit form,
+        as main.py does, that blocks the session's script thread for as long; callers that
+        must stay responsive should run it off the UI thread or call add_keywords_bulk themselves.
+        
+        Raises:
+            PartialFailureError: If a batch job rejected some keywords. Its resource_names
+                holds the keywords that were created, and the audit record is PARTIAL_FAILURE
+            BatchJobTimeoutError: If the batch job is still running after BATCH_JOB_TIMEOUT.
+                Keywords may still be created; batch_job_resource_name identifies the job
+            APIError: If the request fails and no keyword was created
+        """
         try:
+            if len(keywords_data) >= self.BATCH_JOB_THRESHOLD:
+                resource_names, failures = self._add_keywords_batch_job(ad_group_resource_name, keywords_data)
+                if failures:
+                    # One rejected keyword can carry several errors, so count the blank names
+                    rejected = resource_names.count("")
+                    raise PartialFailureError(
+                        message=(f"Batch job rejected {rejected} of {len(keywords_data)} keywords; "
+                                 f"the other {len(keywords_data) - rejected} were created"),
+                        resource_names=resource_names,
+                        error_code="BATCH_JOB_PARTIAL_FAILURE",
+                        api_errors=failures
+                    )
+                return resource_names
+            
             ad_group_criterion_service = self.base_client.get_ad_group_criterion_service()
             operations = []
             
+            criterion_operation_type = self._criterion_operation_type
+            populate_keyword = self._populate_keyword
             for keyword_data in keywords_data:
-                ad_group_criterion_operation = self.client.get_type("AdGroupCriterionOperation")
-                ad_group_criterion = ad_group_criterion_operation.create
-                
-                ad_group_criterion.ad_group = ad_group_resource_name
-                ad_group_criterion.status = self.client.enums.AdGroupCriterionStatusEnum[
-                    keyword_data.get('status', 'ENABLED')
-                ]
-                
-                # Set keyword and match type
-                ad_group_criterion.keyword.text = keyword_data['text']
-                ad_group_criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum[
-                    keyword_data.get('match_type', 'BROAD')
-                ]
-                
-                # Set CPC bid if provided
-                if 'cpc_bid_micros' in keyword_data and keyword_data['cpc_bid_micros']:
-                    ad_group_criterion.cpc_bid_micros = keyword_data['cpc_bid_micros']
-                
+                ad_group_criterion_operation = criterion_operation_type()
+                populate_keyword(ad_group_criterion_operation.create, ad_group_resource_name, keyword_data)
                 operations.append(ad_group_criterion_operation)
             
             response = ad_group_criterion_service.mutate_ad_group_criteria(
                 customer_id=self.customer_id,
                 operations=operations
             )
+            self.invalidate_query_cache()
+            
+            return list(map(get_resource_name, response.results))
             
-            return [result.resource_name for result in response.results]
+        except GoogleAdsException as ex:
+            raise self.base_client.handle_exception(ex)
+    
+    @audit_log_batch("CREATE", "KEYWORD")
+    def add_keywords_bulk(self, ad_group_resource_name: str,
+                          keywords_data: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Add many keywords to an ad group through an asynchronous batch job
+        
+        The API applies the operations on its side with no per-request operation limit.
+        Each keyword succeeds or fails on its own. Blocks until the job has finished.
+        
+        Args:
+            ad_group_resource_name: Ad group to add the keywords to
+            keywords_data: One dict per keyword, as for add_keywords
+        
+        Returns:
+            Resource names in input order (empty strings for rejected entries), and one error
+            dict per rejected entry with its ``index`` in ``keywords_data``
+        
+        Raises:
+            BatchJobTimeoutError: If the job does not finish within BATCH_JOB_TIMEOUT
+            APIError: If the job cannot be created or run
+        """
+        if not keywords_data:
+            return [], []
+        
+        try:
+            return self._add_keywords_batch_job(ad_group_resource_name, keywords_data)
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
+    def _add_keywords_batch_job(self, ad_group_resource_name: str,
+                                keywords_data: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Create keywords through a batch job; see add_keywords_bulk"""
+        operations = []
+        mutate_operation_type = self._mutate_operation_type
+        populate_keyword = self._populate_keyword
+        for keyword_data in keywords_data:
+            mutate_operation = mutate_operation_type()
+            populate_keyword(mutate_operation.ad_group_criterion_operation.create,
+                             ad_group_resource_name, keyword_data)
+            operations.append(mutate_operation)
+        
+        try:
+            return self._run_batch_job(operations)
+        finally:
+            # Some operations may have been applied even if waiting for the job failed
+            self.invalidate_query_cache()
+    
+    def _run_batch_job(self, operations: List[Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Upload MutateOperations to a new batch job, run it and collect its results
+        
+        Returns:
+            Resource names in input order (empty strings for rejected operations), and the
+            per-operation errors indexed into ``operations``
+        """
+        batch_job_service = self.base_client.get_batch_job_service()
+        
+        batch_job_operation = self.client.get_type("BatchJobOperation")
+        batch_job_operation.create = self.client.get_type("BatchJob")
+        response = batch_job_service.mutate_batch_job(
+            customer_id=self.customer_id,
+            operation=batch_job_operation
+        )
+        batch_job_resource_name = response.result.resource_name
+        
+        # Each upload must pass the sequence token returned by the previous one
+        sequence_token = None
+        for start in range(0, len(operations), self.BATCH_JOB_UPLOAD_CHUNK_SIZE):
+            response = batch_job_service.add_batch_job_operations(
+                resource_name=batch_job_resource_name,
+                sequence_token=sequence_token,
+                mutate_operations=operations[start:start + self.BATCH_JOB_UPLOAD_CHUNK_SIZE]
+            )
+            sequence_token = response.next_sequence_token
+        
+        # run_batch_job returns a long-running operation; done() asks the API for its state
+        job = batch_job_service.run_batch_job(resource_name=batch_job_resource_name)
+        delay = self.BATCH_JOB_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + self.BATCH_JOB_TIMEOUT
+        while not job.done():
+            if time.monotonic() >= deadline:
+                raise BatchJobTimeoutError(
+                    message=(f"Batch job {batch_job_resource_name} did not finish within "
+                             f"{self.BATCH_JOB_TIMEOUT:.0f} seconds; it is still running"),
+                    batch_job_resource_name=batch_job_resource_name,
+                    error_code="BATCH_JOB_TIMEOUT"
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, self.BATCH_JOB_POLL_MAX_DELAY)
+        
+        resource_names = [""] * len(operations)
+        failures = []
+        request = self.client.get_type("ListBatchJobResultsRequest")
+        request.resource_name = batch_job_resource_name
+        request.page_size = 1000
+        for result in batch_job_service.list_batch_job_results(request=request):
+            index = result.operation_index
+            if result.status.code == 0:
+                resource_names[index] = result.mutate_operation_response.ad_group_criterion_result.resource_name
+                continue
+            errors = self.base_client.status_errors(result.status) or [{
+                'error_code': None,
+                'message': result.status.message,
+                'trigger': None
+            }]
+            for error in errors:
+                error['index'] = index
+                failures.append(error)
+        
+        return resource_names, failures
+    
     def add_negative_keywords_to_campaign(self, campaign_resource_name: str, negative_keywords_data: List[Dict[str, Any]]) -> bool:
         """Add negative keywords to a campaign"""
         try:
             campaign_criterion_service = self.base_client.get_campaign_criterion_service()
             operations = []
+            campaign_criterion_operation_type = self._campaign_criterion_operation_type
+            match_type_enum = self._match_type_enum
             
             for keyword_data in negative_keywords_data:
-                campaign_criterion_operation = self.client.get_type("CampaignCriterionOperation")
+                campaign_criterion_operation = campaign_criterion_operation_type()
                 campaign_criterion = campaign_criterion_operation.create
                 
                 campaign_criterion.campaign = campaign_resource_name
                 campaign_criterion.negative = True
                 campaign_criterion.keyword.text = keyword_data['text']
-                campaign_criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum[
-                    keyword_data.get('match_type', 'BROAD')
-                ]
+                campaign_criterion.keyword.match_type = match_type_enum[keyword_data.get('match_type', 'BROAD')]
                 
                 operations.append(campaign_criterion_operation)
             
@@ -89,6 +283,7 @@ class KeywordManager:
                 customer_id=self.customer_id,
                 operations=operations
             )
+            self.invalidate_query_cache()
             
             return True
             
@@ -101,11 +296,11 @@ class KeywordManager:
         try:
             ad_group_criterion_service = self.base_client.get_ad_group_criterion_service()
             
-            ad_group_criterion_operation = self.client.get_type("AdGroupCriterionOperation")
+            ad_group_criterion_operation = self._criterion_operation_type()
             ad_group_criterion = ad_group_criterion_operation.update
             
             ad_group_criterion.resource_name = keyword_resource_name
-            ad_group_criterion.status = self.client.enums.AdGroupCriterionStatusEnum[status]
+            ad_group_criterion.status = self._criterion_status_enum[status]
             
             field_mask = field_mask_pb2.FieldMask()
             field_mask.paths.append("status")
@@ -115,6 +310,7 @@ class KeywordManager:
                 customer_id=self.customer_id,
                 operations=[ad_group_criterion_operation]
             )
+            self.invalidate_query_cache()
             
             return response.results[0].resource_name
             
@@ -126,7 +322,7 @@ class KeywordManager:
         try:
             ad_group_criterion_service = self.base_client.get_ad_group_criterion_service()
             
-            ad_group_criterion_operation = self.client.get_type("AdGroupCriterionOperation")
+            ad_group_criterion_operation = self._criterion_operation_type()
             ad_group_criterion = ad_group_criterion_operation.update
             
             ad_group_criterion.resource_name = keyword_resource_name
@@ -140,6 +336,7 @@ class KeywordManager:
                 customer_id=self.customer_id,
                 operations=[ad_group_criterion_operation]
             )
+            self.invalidate_query_cache()
             
             return response.results[0].resource_name
             
@@ -151,43 +348,24 @@ class KeywordManager:
         try:
             ad_group_criterion_service = self.base_client.get_ad_group_criterion_service()
             
-            ad_group_criterion_operation = self.client.get_type("AdGroupCriterionOperation")
+            ad_group_criterion_operation = self._criterion_operation_type()
             ad_group_criterion_operation.remove = keyword_resource_name
             
             response = ad_group_criterion_service.mutate_ad_group_criteria(
                 customer_id=self.customer_id,
                 operations=[ad_group_criterion_operation]
             )
+            self.invalidate_query_cache()
             
             return response.results[0].resource_name
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def list_keywords(self, ad_group_id: Optional[str] = None, include_removed: bool = False) -> List[Dict[str, Any]]:
-        """List keywords"""
+    def iter_keywords(self, ad_group_id: Optional[str] = None, include_removed: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield keywords row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    ad_group_criterion.criterion_id,
-                    ad_group_criterion.keyword.text,
-                    ad_group_criterion.keyword.match_type,
-                    ad_group_criterion.status,
-                    ad_group_criterion.cpc_bid_micros,
-                    ad_group_criterion.quality_info.quality_score,
-                    ad_group.id,
-                    ad_group.name,
-                    campaign.id,
-                    campaign.name
-                FROM ad_group_criterion
-                WHERE ad_group_criterion.type = 'KEYWORD'
-            """
-            
-            conditions = []
-            if not include_removed:
-                conditions.append("ad_group_criterion.status != 'REMOVED'")
+            query = self._KEYWORDS_QUERY_ALL if include_removed else self._KEYWORDS_QUERY_ACTIVE
             
             if ad_group_id:
                 # Convert ad group ID to resource name if needed
@@ -195,16 +373,12 @@ class KeywordManager:
                     ad_group_resource_name = ad_group_id
                 else:
                     ad_group_resource_name = f"customers/{self.customer_id}/adGroups/{ad_group_id}"
-                conditions.append(f"ad_group_criterion.ad_group = '{ad_group_resource_name}'")
-            
-            if conditions:
-                query += " AND " + " AND ".join(conditions)
+                query = f"{query} AND ad_group_criterion.ad_group = '{ad_group_resource_name}'"
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
-            keywords = []
-            for row in response:
-                keywords.append({
+            for row in rows:
+                yield {
                     'criterion_id': row.ad_group_criterion.criterion_id,
                     'text': row.ad_group_criterion.keyword.text,
                     'match_type': row.ad_group_criterion.keyword.match_type.name,
@@ -216,76 +390,50 @@ class KeywordManager:
                     'campaign_id': row.campaign.id,
                     'campaign_name': row.campaign.name,
                     'resource_name': f"customers/{self.customer_id}/adGroupCriteria/{row.ad_group.id}~{row.ad_group_criterion.criterion_id}"
-                })
-            
-            return keywords
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def list_campaign_negative_keywords(self) -> List[Dict[str, Any]]:
-        """List negative keywords for campaigns"""
+    @cached_query
+    def list_keywords(self, ad_group_id: Optional[str] = None, include_removed: bool = False) -> List[Dict[str, Any]]:
+        """List keywords"""
+        return list(self.iter_keywords(ad_group_id, include_removed))
+    
+    def iter_campaign_negative_keywords(self) -> Iterator[Dict[str, Any]]:
+        """Yield campaign negative keywords row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = """
-                SELECT
-                    campaign_criterion.criterion_id,
-                    campaign_criterion.keyword.text,
-                    campaign_criterion.keyword.match_type,
-                    campaign.id,
-                    campaign.name
-                FROM campaign_criterion
-                WHERE campaign_criterion.type = 'KEYWORD'
-                AND campaign_criterion.negative = TRUE
-            """
-            
-            response = ga_service.search(customer_id=self.customer_id, query=query)
-            
-            negative_keywords = []
-            for row in response:
-                negative_keywords.append({
+            query = self._CAMPAIGN_NEGATIVE_KEYWORDS_QUERY
+            
+            rows = self.base_client.search_stream_rows(query)
+            
+            for row in rows:
+                yield {
                     'criterion_id': row.campaign_criterion.criterion_id,
                     'text': row.campaign_criterion.keyword.text,
                     'match_type': row.campaign_criterion.keyword.match_type.name,
                     'campaign_id': row.campaign.id,
                     'campaign_name': row.campaign.name,
                     'resource_name': f"customers/{self.customer_id}/campaignCriteria/{row.campaign_criterion.criterion_id}"
-                })
-            
-            return negative_keywords
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def get_keyword_performance(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get keyword performance data"""
+    @cached_query
+    def list_campaign_negative_keywords(self) -> List[Dict[str, Any]]:
+        """List negative keywords for campaigns"""
+        return list(self.iter_campaign_negative_keywords())
+    
+    def iter_keyword_performance(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield keyword performance data row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = f"""
-                SELECT
-                    ad_group_criterion.keyword.text,
-                    ad_group_criterion.keyword.match_type,
-                    ad_group.name,
-                    campaign.name,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.cost_per_conversion
-                FROM keyword_view
-                WHERE segments.date DURING {date_range}
-                AND ad_group_criterion.status = 'ENABLED'
-            """
-            
-            response = ga_service.search(customer_id=self.customer_id, query=query)
-            
-            performance_data = []
-            for row in response:
-                performance_data.append({
+            query = self._KEYWORD_PERFORMANCE_QUERY.format(date_range=date_range)
+            
+            rows = self.base_client.search_stream_rows(query)
+            
+            for row in rows:
+                yield {
                     'keyword_text': row.ad_group_criterion.keyword.text,
                     'match_type': row.ad_group_criterion.keyword.match_type.name,
                     'ad_group_name': row.ad_group.name,
@@ -297,9 +445,12 @@ class KeywordManager:
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc,
                     'cost_per_conversion': row.metrics.cost_per_conversion
-                })
-            
-            return performance_data
+                }
             
         except GoogleAdsException as ex:
-            raise self.base_client.handle_exception(ex)
\ No newline at end of file
+            raise self.base_client.handle_exception(ex)
+    
+    @cached_query
+    def get_keyword_performance(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get keyword performance data"""
+        return list(self.iter_keyword_performance(date_range))
\ No newline at end of file
@@ -1,43 +1,131 @@
 """Reporting and analytics functionality"""
 
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 import pandas as pd
 from google.ads.googleads.errors import GoogleAdsException
-from ..core.base_client import BaseGoogleAdsClient
+from ..core.base_client import BaseGoogleAdsClient, bind_audit_identity
+from ..core.query_cache import cached_query
 from ..core.exceptions import APIError
 
 class ReportingManager:
     """Manager for Google Ads reporting operations"""
     
+    # Threads used by fetch_all_metrics; more than this did not shorten the fan-out
+    MAX_REPORT_WORKERS = 8
+    
+    # One pool for the process, shared by every session's manager; created on first use
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+    
+    # Report queries, built once; each is formatted with the GAQL date range
+    _CUSTOMER_METRICS_QUERY = (
+        "SELECT customer.id, metrics.clicks, metrics.impressions, metrics.cost_micros, "
+        "metrics.conversions, metrics.ctr, metrics.average_cpc, metrics.cost_per_conversion "
+        "FROM customer "
+        "WHERE segments.date DURING {date_range}"
+    )
+    _CAMPAIGN_METRICS_QUERY = (
+        "SELECT campaign.id, campaign.name, campaign.status, metrics.clicks, "
+        "metrics.impressions, metrics.cost_micros, metrics.conversions, metrics.ctr, "
+        "metrics.average_cpc, metrics.cost_per_conversion "
+        "FROM campaign "
+        "WHERE segments.date DURING {date_range} "
+        "AND campaign.status != 'REMOVED'"
+    )
+    _AD_GROUP_AD_METRICS_QUERY = (
+        "SELECT campaign.name, ad_group.name, ad_group_ad.ad.id, ad_group_ad.status, "
+        "metrics.clicks, metrics.impressions, metrics.cost_micros, metrics.conversions, "
+        "metrics.ctr, metrics.average_cpc, metrics.cost_per_conversion "
+        "FROM ad_group_ad "
+        "WHERE segments.date DURING {date_range} "
+        "AND ad_group_ad.status != 'REMOVED'"
+    )
+    _SEARCH_TERM_VIEW_METRICS_QUERY = (
+        "SELECT campaign.name, ad_group.name, search_term_view.search_term, "
+        "search_term_view.status, metrics.clicks, metrics.impressions, metrics.cost_micros, "
+        "metrics.conversions, metrics.ctr, metrics.average_cpc "
+        "FROM search_term_view "
+        "WHERE segments.date DURING {date_range}"
+    )
+    _BIDDING_STRATEGY_PERFORMANCE_QUERY = (
+        "SELECT bidding_strategy.id, bidding_strategy.name, bidding_strategy.type, "
+        "metrics.clicks, metrics.impressions, metrics.cost_micros, metrics.conversions, "
+        "metrics.ctr, metrics.average_cpc, metrics.cost_per_conversion "
+        "FROM bidding_strategy "
+        "WHERE segments.date DURING {date_range}"
+    )
+    
+    # Seconds a report result is served from memory
+    QUERY_CACHE_TTL = 60.0
+    
     def __init__(self, client: BaseGoogleAdsClient):
         self.client = client.client
         self.customer_id = client.customer_id
         self.base_client = client
+        self._query_cache = client.query_cache
     
-    def get_customer_metrics(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get customer-level metrics"""
+    def invalidate_query_cache(self) -> None:
+        """Drop cached query results, this manager's and those of the others on its client"""
+        self.base_client.invalidate_query_cache()
+    
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """Return the process-wide report thread pool, creating it on first use"""
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ThreadPoolExecutor(
+                    max_workers=cls.MAX_REPORT_WORKERS,
+                    thread_name_prefix="ads-report"
+                )
+            return cls._pool
+    
+    def fetch_all_metrics(self, date_range: str, use_cache: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+        """Run every metrics report for a date range concurrently
+        
+        The queries are independent and spend their time waiting on the API, so the
+        total wait is roughly that of the slowest report rather than the sum of all.
+        They run on one thread pool shared by every manager in the process.
+        
+        Args:
+            date_range: GAQL date range such as LAST_7_DAYS
+            use_cache: Set False to bypass cached report results
+        
+        Returns:
+            Mapping of report type (as passed to create_dataframe) to its rows
+        
+        Raises:
+            APIError: If any of the reports fails
+        """
+        reports = {
+            'customer': self.get_customer_metrics,
+            'campaign': self.get_campaign_metrics,
+            'ad': self.get_ad_group_ad_metrics,
+            'search_terms': self.get_search_term_view_metrics,
+            'bidding_strategy': self.get_bidding_strategy_performance,
+        }
+        pool = self._get_pool()
+        # Each report is bound here, on the calling thread, so errors it logs carry the caller's identity
+        futures = {
+            pool.submit(bind_audit_identity(fetch), date_range, use_cache=use_cache): report_type
+            for report_type, fetch in reports.items()
+        }
+        
+        results = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+    
+    def iter_customer_metrics(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield customer-level metrics row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = f"""
-                SELECT
-                    customer.id,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.cost_per_conversion
-                FROM customer
-                WHERE segments.date DURING {date_range}
-            """
+            query = self._CUSTOMER_METRICS_QUERY.format(date_range=date_range)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
-            metrics_data = []
-            for row in response:
-                metrics_data.append({
+            for row in rows:
+                yield {
                     'customer_id': row.customer.id,
                     'clicks': row.metrics.clicks,
                     'impressions': row.metrics.impressions,
@@ -46,40 +134,25 @@ class ReportingManager:
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc,
                     'cost_per_conversion': row.metrics.cost_per_conversion
-                })
-            
-            return metrics_data
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def get_campaign_metrics(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get campaign-level metrics"""
+    @cached_query
+    def get_customer_metrics(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get customer-level metrics"""
+        return list(self.iter_customer_metrics(date_range))
+    
+    def iter_campaign_metrics(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield campaign-level metrics row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
+            query = self._CAMPAIGN_METRICS_QUERY.format(date_range=date_range)
             
-            query = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.cost_per_conversion
-                FROM campaign
-                WHERE segments.date DURING {date_range}
-                AND campaign.status != 'REMOVED'
-            """
+            rows = self.base_client.search_stream_rows(query)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
-            
-            metrics_data = []
-            for row in response:
-                metrics_data.append({
+            for row in rows:
+                yield {
                     'campaign_id': row.campaign.id,
                     'campaign_name': row.campaign.name,
                     'campaign_status': row.campaign.status.name,
@@ -90,41 +163,25 @@ class ReportingManager:
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc,
                     'cost_per_conversion': row.metrics.cost_per_conversion
-                })
-            
-            return metrics_data
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def get_ad_group_ad_metrics(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get ad group ad metrics"""
+    @cached_query
+    def get_campaign_metrics(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get campaign-level metrics"""
+        return list(self.iter_campaign_metrics(date_range))
+    
+    def iter_ad_group_ad_metrics(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield ad group ad metrics row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = f"""
-                SELECT
-                    campaign.name,
-                    ad_group.name,
-                    ad_group_ad.ad.id,
-                    ad_group_ad.status,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.cost_per_conversion
-                FROM ad_group_ad
-                WHERE segments.date DURING {date_range}
-                AND ad_group_ad.status != 'REMOVED'
-            """
+            query = self._AD_GROUP_AD_METRICS_QUERY.format(date_range=date_range)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
-            metrics_data = []
-            for row in response:
-                metrics_data.append({
+            for row in rows:
+                yield {
                     'campaign_name': row.campaign.name,
                     'ad_group_name': row.ad_group.name,
                     'ad_id': row.ad_group_ad.ad.id,
@@ -136,39 +193,25 @@ class ReportingManager:
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc,
                     'cost_per_conversion': row.metrics.cost_per_conversion
-                })
-            
-            return metrics_data
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def get_search_term_view_metrics(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get search term view metrics"""
+    @cached_query
+    def get_ad_group_ad_metrics(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get ad group ad metrics"""
+        return list(self.iter_ad_group_ad_metrics(date_range))
+    
+    def iter_search_term_view_metrics(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield search term view metrics row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
-            
-            query = f"""
-                SELECT
-                    campaign.name,
-                    ad_group.name,
-                    search_term_view.search_term,
-                    search_term_view.status,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc
-                FROM search_term_view
-                WHERE segments.date DURING {date_range}
-            """
+            query = self._SEARCH_TERM_VIEW_METRICS_QUERY.format(date_range=date_range)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
+            rows = self.base_client.search_stream_rows(query)
             
-            metrics_data = []
-            for row in response:
-                metrics_data.append({
+            for row in rows:
+                yield {
                     'campaign_name': row.campaign.name,
                     'ad_group_name': row.ad_group.name,
                     'search_term': row.search_term_view.search_term,
@@ -179,39 +222,25 @@ class ReportingManager:
                     'conversions': row.metrics.conversions,
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc
-                })
-            
-            return metrics_data
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def get_bidding_strategy_performance(self, date_range: str) -> List[Dict[str, Any]]:
-        """Get bidding strategy performance metrics"""
+    @cached_query
+    def get_search_term_view_metrics(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get search term view metrics"""
+        return list(self.iter_search_term_view_metrics(date_range))
+    
+    def iter_bidding_strategy_performance(self, date_range: str) -> Iterator[Dict[str, Any]]:
+        """Yield bidding strategy performance metrics row by row as they arrive from the stream"""
         try:
-            ga_service = self.base_client.get_google_ads_service()
+            query = self._BIDDING_STRATEGY_PERFORMANCE_QUERY.format(date_range=date_range)
             
-            query = f"""
-                SELECT
-                    bidding_strategy.id,
-                    bidding_strategy.name,
-                    bidding_strategy.type,
-                    metrics.clicks,
-                    metrics.impressions,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.cost_per_conversion
-                FROM bidding_strategy
-                WHERE segments.date DURING {date_range}
-            """
+            rows = self.base_client.search_stream_rows(query)
             
-            response = ga_service.search(customer_id=self.customer_id, query=query)
-            
-            metrics_data = []
-            for row in response:
-                metrics_data.append({
+            for row in rows:
+                yield {
                     'strategy_id': row.bidding_strategy.id,
                     'strategy_name': row.bidding_strategy.name,
                     'strategy_type': row.bidding_strategy.type_.name,
@@ -222,19 +251,22 @@ class ReportingManager:
                     'ctr': row.metrics.ctr,
                     'average_cpc': row.metrics.average_cpc,
                     'cost_per_conversion': row.metrics.cost_per_conversion
-                })
-            
-            return metrics_data
+                }
             
         except GoogleAdsException as ex:
             raise self.base_client.handle_exception(ex)
     
-    def create_dataframe(self, data: List[Dict[str, Any]], report_type: str) -> pd.DataFrame:
-        """Create a pandas DataFrame from report data with cost conversions"""
-        if not data:
-            return pd.DataFrame()
+    @cached_query
+    def get_bidding_strategy_performance(self, date_range: str) -> List[Dict[str, Any]]:
+        """Get bidding strategy performance metrics"""
+        return list(self.iter_bidding_strategy_performance(date_range))
+    
+    def create_dataframe(self, data: Iterable[Dict[str, Any]], report_type: str) -> pd.DataFrame:
+        """Create a pandas DataFrame from report data with cost conversions
         
-        df = pd.DataFrame(data)
+        data may be a list or one of the iter_* generators, which is consumed as it streams.
+        """
+        df = pd.DataFrame.from_records(data)
         
         # Convert cost from micros to dollars
         if 'cost_micros' in df.columns:
@@ -4,7 +4,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
-from google_ads_sdk import GoogleAdsSDK, GoogleAdsCredentials
+from google_ads_sdk import GoogleAdsSDK, GoogleAdsCredentials, BatchJobTimeoutError
 from audit_logger import audit_logger
 
 # Page configuration
@@ -15,6 +15,59 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Static installation guide for the Conversion Tracking page, pre-rendered
+# to HTML so reruns skip Streamlit's markdown parsing
+CONVERSION_GUIDE_HTML = """
+<h3>What is Conversion Tracking?</h3>
+<p>Conversion tracking helps you measure the actions that matter most to your business (purchases, sign-ups, calls, etc.)
+that result from your Google Ads campaigns.</p>
+
+<h3>Setup Process:</h3>
+<ol>
+<li><strong>Create Conversion Actions</strong> - Define what actions you want to track</li>
+<li><strong>Generate Code Snippets</strong> - Get the tracking codes for your website</li>
+<li><strong>Install Tracking Codes</strong> - Add the codes to your website</li>
+<li><strong>Test &amp; Verify</strong> - Make sure tracking is working properly</li>
+</ol>
+
+<h3>Types of Conversions:</h3>
+<ul>
+<li><strong>Website Conversions</strong>: Track actions on your website (purchases, form submissions, etc.)</li>
+<li><strong>Call Conversions</strong>: Track phone calls from your ads</li>
+<li><strong>App Conversions</strong>: Track app installs and in-app actions</li>
+<li><strong>Import Conversions</strong>: Upload offline conversion data</li>
+</ul>
+
+<h3>Testing Your Implementation:</h3>
+<ul>
+<li>Use Google Tag Assistant Chrome extension</li>
+<li>Check Chrome DevTools Console for errors</li>
+<li>Look for conversion data in your Google Ads account (may take 24-48 hours)</li>
+<li>Test actual conversions to verify tracking</li>
+</ul>
+
+<h3>Common Issues:</h3>
+<ul>
+<li><strong>Code not firing</strong>: Check if JavaScript is properly loaded</li>
+<li><strong>No conversions recorded</strong>: Verify code is on the correct pages</li>
+<li><strong>Duplicate tracking</strong>: Don't install the same code multiple times</li>
+<li><strong>Wrong values</strong>: Make sure dynamic values are properly passed</li>
+</ul>
+"""
+
+# Audit log columns shown on the Audit Logs page, mapped to display headers
+AUDIT_LOG_DISPLAY_COLUMNS = {
+    'timestamp': 'Timestamp',
+    'user_id': 'User',
+    'operation_type': 'Operation',
+    'resource_type': 'Resource',
+    'function_name': 'Function',
+    'result_status': 'Status',
+    'execution_time_ms': 'Execution Time (ms)',
+    'resource_id': 'Resource ID',
+    'error_message': 'Error'
+}
+
 # Initialize session state
 if 'ads_sdk' not in st.session_state:
     st.session_state.ads_sdk = None
@@ -127,15 +180,16 @@ def campaign_management_page():
     
     with tab2:
         st.subheader("Existing Campaigns")
-        campaigns = campaign_manager.list_campaigns()
+        campaign_columns = campaign_manager.list_campaign_columns()
         
-        if campaigns:
-            df = pd.DataFrame(campaigns)
+        if campaign_columns['id']:
+            df = pd.DataFrame(campaign_columns)
             st.dataframe(df)
             
             # Campaign actions
             selected_campaign = st.selectbox("Select Campaign", 
-                options=[f"{c['name']} (ID: {c['id']})" for c in campaigns])
+                options=[f"{name} (ID: {campaign_id})"
+                         for name, campaign_id in zip(campaign_columns['name'], campaign_columns['id'])])
             
             if selected_campaign:
                 campaign_id = selected_campaign.split("ID: ")[1].split(")")[0]
@@ -679,7 +733,7 @@ def ad_group_management_page():
             if filtered_ads:
                 # Display ads with management controls
                 for i, ad in enumerate(filtered_ads):
-                    with st.expander(f"Ad {i+1}: {ad.get('headline1', 'No headline')} - {ad.get('status', 'Unknown Status')}"):
+                    with st.expander(f"Ad {i+1}: {ad.get('headline1') or 'No headline'} - {ad.get('status', 'Unknown Status')}"):
                         col1, col2, col3 = st.columns([2, 1, 1])
                         
                         with col1:
@@ -808,7 +862,13 @@ def keyword_management_page():
                                 })
                         
                         if keywords_data:
-                            result = keyword_manager.add_keywords(ad_group_resource_name, keywords_data)
+                            try:
+                                result = keyword_manager.add_keywords(ad_group_resource_name, keywords_data)
+                            except BatchJobTimeoutError as e:
+                                # The job keeps running, so the keywords may still be added
+                                st.warning(f"Keywords are still being added by batch job "
+                                           f"`{e.batch_job_resource_name}`. Check the keyword list again later.")
+                                result = None
                             if result:
                                 st.success(f"Added {len(keywords_data)} keywords successfully!")
         else:
@@ -1721,65 +1781,32 @@ def conversion_tracking_page():
             df = pd.DataFrame(conversions)
             st.dataframe(df)
             
-            # Enable/Disable conversions
+            # Enable/Disable conversions - changes are queued and applied in one request
             st.subheader("Enable/Disable Conversion Actions")
-            conversion_to_manage = st.selectbox("Select Conversion to Manage", 
-                [f"{c['name']} (Status: {c.get('status', 'Unknown')})" for c in conversions])
+            pending = st.session_state.setdefault('pending_status', {})
             
-            if conversion_to_manage:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if st.button("Enable Conversion"):
-                        # Extract conversion details for resource name construction
-                        selected_conv = [c for c in conversions if c['name'] in conversion_to_manage][0]
-                        resource_name = f"customers/{conversion_manager.customer_id}/conversionActions/{selected_conv['id']}"
-                        result = conversion_manager.update_conversion_action_status(resource_name, "ENABLED")
-                        if result:
-                            st.rerun()
+            for conv in conversions:
+                currently_enabled = conv.get('status') == 'ENABLED'
+                enabled = st.checkbox(f"{conv['name']} (Status: {conv.get('status', 'Unknown')})",
+                                      value=currently_enabled, key=f"conversion_enabled_{conv['id']}")
                 
-                with col2:
-                    if st.button("Disable Conversion"):
-                        selected_conv = [c for c in conversions if c['name'] in conversion_to_manage][0]
-                        resource_name = f"customers/{conversion_manager.customer_id}/conversionActions/{selected_conv['id']}"
-                        result = conversion_manager.update_conversion_action_status(resource_name, "PAUSED")
-                        if result:
-                            st.rerun()
+                if enabled != currently_enabled:
+                    pending[conv['resource_name']] = "ENABLED" if enabled else "PAUSED"
+                else:
+                    pending.pop(conv['resource_name'], None)
+            
+            if st.button(f"Apply Changes ({len(pending)})", disabled=not pending):
+                result = conversion_manager.bulk_update_statuses(pending)
+                if result:
+                    st.session_state.pending_status = {}
+                    st.rerun()
         else:
             st.info("No conversion actions found. Create your first conversion action above.")
     
     with tab4:
         st.subheader("📚 Conversion Tracking Installation Guide")
         
-        st.markdown("""
-        ### What is Conversion Tracking?
-        Conversion tracking helps you measure the actions that matter most to your business (purchases, sign-ups, calls, etc.) 
-        that result from your Google Ads campaigns.
-        
-        ### Setup Process:
-        1. **Create Conversion Actions** - Define what actions you want to track
-        2. **Generate Code Snippets** - Get the tracking codes for your website
-        3. **Install Tracking Codes** - Add the codes to your website
-        4. **Test & Verify** - Make sure tracking is working properly
-        
-        ### Types of Conversions:
-        - **Website Conversions**: Track actions on your website (purchases, form submissions, etc.)
-        - **Call Conversions**: Track phone calls from your ads
-        - **App Conversions**: Track app installs and in-app actions
-        - **Import Conversions**: Upload offline conversion data
-        
-        ### Testing Your Implementation:
-        - Use Google Tag Assistant Chrome extension
-        - Check Chrome DevTools Console for errors
-        - Look for conversion data in your Google Ads account (may take 24-48 hours)
-        - Test actual conversions to verify tracking
-        
-        ### Common Issues:
-        - **Code not firing**: Check if JavaScript is properly loaded
-        - **No conversions recorded**: Verify code is on the correct pages
-        - **Duplicate tracking**: Don't install the same code multiple times
-        - **Wrong values**: Make sure dynamic values are properly passed
-        """)
+        st.html(CONVERSION_GUIDE_HTML)
 
 def audit_logs_page():
     st.header("📋 Audit Logs & Job History")
@@ -1798,6 +1825,7 @@ def audit_logs_page():
                                    help="This will identify you in all future operations")
         if st.button("Update User ID") and new_user_id != current_user:
             st.session_state.user_id = new_user_id
+            audit_logger.reset_identity()
             st.success(f"User ID updated to: {new_user_id}")
             st.rerun()
     
@@ -1820,7 +1848,9 @@ def audit_logs_page():
         successful_ops = stats.get('status_breakdown', {}).get('SUCCESS', 0)
         st.metric("Successful Operations", successful_ops)
     with col4:
-        failed_ops = stats.get('status_breakdown', {}).get('ERROR', 0)
+        # Bulk calls that had some operations rejected count as failed
+        status_breakdown = stats.get('status_breakdown', {})
+        failed_ops = status_breakdown.get('ERROR', 0) + status_breakdown.get('PARTIAL_FAILURE', 0)
         st.metric("Failed Operations", failed_ops)
     
     # Charts
@@ -1887,22 +1917,11 @@ def audit_logs_page():
         if logs:
             st.subheader("📄 Audit Log Records")
             
-            # Create a DataFrame for better display
-            df_data = []
-            for log in logs:
-                df_data.append({
-                    'Timestamp': log['timestamp'],
-                    'User': log['user_id'],
-                    'Operation': log['operation_type'],
-                    'Resource': log['resource_type'],
-                    'Function': log['function_name'],
-                    'Status': log['result_status'],
-                    'Execution Time (ms)': log['execution_time_ms'],
-                    'Resource ID': log['resource_id'] or 'N/A',
-                    'Error': log['error_message'] or 'None'
-                })
-            
-            df = pd.DataFrame(df_data)
+            # Create a DataFrame for better display in a single bulk copy
+            df = pd.DataFrame.from_records(logs, columns=list(AUDIT_LOG_DISPLAY_COLUMNS))
+            df = df.rename(columns=AUDIT_LOG_DISPLAY_COLUMNS)
+            df['Resource ID'] = df['Resource ID'].fillna('N/A')
+            df['Error'] = df['Error'].fillna('None')
             
             # Display summary
             st.write(f"**Showing {len(df)} records**")
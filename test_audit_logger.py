@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Tests for the audit logger's identity handling and recorded results
+Run with: python -m unittest test_audit_logger
+"""
+
+import asyncio
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import unittest
+import zlib
+from types import SimpleNamespace
+from unittest import mock
+
+import audit_logger
+
+try:
+    from google_ads_sdk.managers.ad_group_manager import AdGroupManager
+    from google_ads_sdk.managers.campaign_manager import CampaignManager
+    from google_ads_sdk.managers.reporting_manager import ReportingManager
+except ImportError:  # google-ads or pandas is not installed
+    AdGroupManager = CampaignManager = ReportingManager = None
+
+AD_RESOURCE_NAME = "customers/1234567890/adGroupAds/111~222"
+BUDGET_RESOURCE_NAME = "customers/1234567890/campaignBudgets/333"
+
+
+class _SessionState(dict):
+    """dict with the attribute access st.session_state offers"""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+class _ScriptThreadStreamlit:
+    """Stand-in for the streamlit module whose session state, like Streamlit's, only
+    exists on the script thread; every other thread gets an empty state of its own"""
+
+    def __init__(self, **state):
+        self._script_thread = threading.get_ident()
+        self._state = _SessionState(state)
+        self._other_threads = threading.local()
+
+    @property
+    def session_state(self):
+        if threading.get_ident() == self._script_thread:
+            return self._state
+        if not hasattr(self._other_threads, 'state'):
+            self._other_threads.state = _SessionState()
+        return self._other_threads.state
+
+
+class AuditLoggerTestCase(unittest.TestCase):
+    """Logs to a fresh database as user alice, customer 1234567890"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.logger = audit_logger.AuditLogger(os.path.join(temp_dir.name, "audit_log.db"))
+
+        patcher = mock.patch.multiple(
+            audit_logger,
+            audit_logger=self.logger,
+            st=_ScriptThreadStreamlit(user_id="alice", customer_id="1234567890", session_id="session_1")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def only_log(self):
+        logs = self.logger.get_audit_logs()
+        self.assertEqual(len(logs), 1)
+        return logs[0]
+
+    def assertCallerIdentity(self, log):
+        self.assertEqual(
+            (log['user_id'], log['customer_id'], log['session_id']),
+            ("alice", "1234567890", "session_1")
+        )
+
+
+class IdentityTest(AuditLoggerTestCase):
+
+    def test_worker_thread_without_pinned_identity_is_anonymous(self):
+        @audit_logger.audit_log("UPDATE", "AD")
+        def update_ad_status(ad_resource_name):
+            return ad_resource_name
+
+        worker = threading.Thread(target=update_ad_status, args=(AD_RESOURCE_NAME,))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(self.only_log()['customer_id'], "unknown")
+
+    def test_to_thread_logs_caller_identity(self):
+        @audit_logger.audit_log("UPDATE", "AD")
+        def update_ad_status(ad_resource_name):
+            return ad_resource_name
+
+        async def update():
+            return await asyncio.to_thread(
+                self.logger.identity_context().run, update_ad_status, AD_RESOURCE_NAME
+            )
+
+        self.assertEqual(asyncio.run(update()), AD_RESOURCE_NAME)
+        log = self.only_log()
+        self.assertCallerIdentity(log)
+        self.assertEqual(log['resource_id'], AD_RESOURCE_NAME)
+
+    @unittest.skipIf(AdGroupManager is None, "google-ads is not installed")
+    def test_async_manager_call_logs_caller_identity(self):
+        base_client = mock.MagicMock(customer_id="1234567890")
+        base_client.get_ad_group_ad_service.return_value.mutate_ad_group_ads.return_value = SimpleNamespace(
+            results=[SimpleNamespace(resource_name=AD_RESOURCE_NAME)]
+        )
+        manager = AdGroupManager(base_client)
+
+        self.assertEqual(asyncio.run(manager.aupdate_ad_status(AD_RESOURCE_NAME, "PAUSED")), AD_RESOURCE_NAME)
+        log = self.only_log()
+        self.assertCallerIdentity(log)
+        self.assertEqual(log['function_name'], "update_ad_status")
+
+    @unittest.skipIf(CampaignManager is None, "google-ads is not installed")
+    def test_async_budget_update_logs_caller_identity(self):
+        base_client = mock.MagicMock(customer_id="1234567890")
+        base_client.get_google_ads_service.return_value.search.return_value = [
+            SimpleNamespace(campaign_budget=SimpleNamespace(resource_name=BUDGET_RESOURCE_NAME))
+        ]
+        base_client.get_campaign_budget_service.return_value.mutate_campaign_budgets.return_value = SimpleNamespace(
+            results=[SimpleNamespace(resource_name=BUDGET_RESOURCE_NAME)]
+        )
+        manager = CampaignManager(base_client)
+
+        budget = asyncio.run(manager.aupdate_campaign_budget("customers/1234567890/campaigns/444", 5_000_000))
+        self.assertEqual(budget, BUDGET_RESOURCE_NAME)
+        log = self.only_log()
+        self.assertCallerIdentity(log)
+        self.assertEqual(log['function_name'], "update_campaign_budget")
+
+    @unittest.skipIf(ReportingManager is None, "google-ads or pandas is not installed")
+    def test_report_threads_log_caller_identity(self):
+        def search_stream_rows(query):
+            self.logger.log_error("API_CALL", "GOOGLE_ADS_API", "handle_exception", RuntimeError(query))
+            return []
+
+        base_client = mock.MagicMock(customer_id="1234567890")
+        base_client.search_stream_rows.side_effect = search_stream_rows
+        ReportingManager(base_client).fetch_all_metrics("LAST_7_DAYS", use_cache=False)
+
+        logs = self.logger.get_audit_logs()
+        self.assertEqual(len(logs), 5)
+        for log in logs:
+            self.assertCallerIdentity(log)
+
+
+class BatchResultTest(AuditLoggerTestCase):
+
+    def test_bulk_call_without_failures_is_success(self):
+        @audit_logger.audit_log_batch("UPDATE", "AD")
+        def update_ad_statuses_bulk(statuses):
+            return list(statuses), []
+
+        update_ad_statuses_bulk({AD_RESOURCE_NAME: "PAUSED"})
+        log = self.only_log()
+        self.assertEqual(log['result_status'], "SUCCESS")
+        self.assertEqual(log['result_data']['resource_names'], [AD_RESOURCE_NAME])
+        self.assertNotIn('failures', log['result_data'])
+
+    def test_bulk_call_with_rejected_operations_is_partial_failure(self):
+        @audit_logger.audit_log_batch("UPDATE", "AD")
+        def update_ad_statuses_bulk(statuses):
+            return [AD_RESOURCE_NAME, ""], [
+                {'index': 1, 'error_code': "MUTATE_ERROR", 'message': "Resource was not found.", 'trigger': None}
+            ]
+
+        update_ad_statuses_bulk({AD_RESOURCE_NAME: "PAUSED", "customers/1234567890/adGroupAds/1~9": "PAUSED"})
+        log = self.only_log()
+        self.assertEqual(log['result_status'], "PARTIAL_FAILURE")
+        self.assertEqual(log['error_code'], "MUTATE_ERROR")
+        self.assertEqual(log['error_message'], "Resource was not found.")
+        self.assertEqual(log['result_data']['resource_names'], [AD_RESOURCE_NAME])
+        self.assertEqual(log['result_data']['failures'], [
+            {'index': 1, 'error_code': "MUTATE_ERROR", 'message': "Resource was not found."}
+        ])
+        self.assertEqual(self.logger.get_operation_stats()['errors_last_24h'], 1)
+
+    def test_failed_count_counts_operations_not_errors(self):
+        @audit_logger.audit_log_batch("CREATE", "KEYWORD")
+        def add_keywords_bulk(ad_group_resource_name, keywords_data):
+            return ["", "customers/1234567890/adGroupCriteria/1~2"], [
+                {'index': 0, 'error_code': "POLICY_FINDING", 'message': "Policy violation.", 'trigger': None},
+                {'index': 0, 'error_code': "INVALID_CHARACTERS", 'message': "Invalid characters.", 'trigger': None}
+            ]
+
+        add_keywords_bulk("customers/1234567890/adGroups/1", [{'text': "bad!"}, {'text': "good"}])
+        result_data = self.only_log()['result_data']
+        self.assertEqual(result_data['failed_count'], 1)
+        self.assertEqual(len(result_data['failures']), 2)
+
+
+class StackTraceTest(AuditLoggerTestCase):
+
+    def log_error_with_trace(self, depth):
+        def fail(remaining):
+            if remaining:
+                fail(remaining - 1)
+            raise RuntimeError("quota exhausted")
+
+        try:
+            fail(depth)
+        except RuntimeError as e:
+            self.logger.log_error("API_CALL", "GOOGLE_ADS_API", "handle_exception", e)
+
+    def stored_traces(self):
+        self.logger.flush()
+        with sqlite3.connect(self.logger.db_path) as conn:
+            return conn.execute("SELECT stack_trace, stack_trace_blob FROM audit_logs").fetchall()
+
+    def test_short_trace_is_stored_as_text(self):
+        # Never raised, so its trace is just the exception line
+        self.logger.log_error("API_CALL", "GOOGLE_ADS_API", "handle_exception", RuntimeError("quota exhausted"))
+        [(text, blob)] = self.stored_traces()
+        self.assertIsInstance(text, str)
+        self.assertIsNone(blob)
+        self.assertIn("RuntimeError: quota exhausted", self.only_log()['stack_trace'])
+
+    def test_long_trace_is_compressed_into_blob_column(self):
+        self.log_error_with_trace(20)
+        [(text, blob)] = self.stored_traces()
+        self.assertIsNone(text)
+        self.assertIsInstance(blob, bytes)
+
+        log = self.only_log()
+        self.assertNotIn('stack_trace_blob', log)
+        self.assertIn("RuntimeError: quota exhausted", log['stack_trace'])
+
+    def test_compressed_trace_in_text_column_is_moved(self):
+        trace = "Traceback (most recent call last):\n" * 20
+        with sqlite3.connect(self.logger.db_path) as conn:
+            conn.execute(
+                "INSERT INTO audit_logs (user_id, customer_id, operation_type, resource_type, function_name, "
+                "result_status, stack_trace, ts_epoch) VALUES ('alice', '1234567890', 'API_CALL', "
+                "'GOOGLE_ADS_API', 'handle_exception', 'ERROR', ?, 0)",
+                (zlib.compress(trace.encode('utf-8')),)
+            )
+        self.logger.init_database()
+
+        [(text, blob)] = self.stored_traces()
+        self.assertIsNone(text)
+        self.assertEqual(self.only_log()['stack_trace'], trace)
+
+
+class DroppedCountTest(AuditLoggerTestCase):
+
+    def test_concurrent_drops_are_all_counted(self):
+        def queue_full(row):
+            raise queue.Full
+
+        # Every entry finds the queue full and is dropped
+        patcher = mock.patch.object(self.logger._queue, 'put_nowait', queue_full)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        def log_many():
+            for _ in range(2000):
+                self.logger.log_operation("UPDATE", "AD", "update_ad_status")
+
+        workers = [threading.Thread(target=log_many) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(self.logger.dropped, 16000)
+
+
+class DisabledTest(AuditLoggerTestCase):
+
+    def test_switched_off_logger_skips_errors(self):
+        self.logger.enabled = False
+        self.logger.log_error("API_CALL", "GOOGLE_ADS_API", "handle_exception", RuntimeError("quota exhausted"))
+        self.logger.enabled = True
+        self.assertEqual(self.logger.get_audit_logs(), [])
+
+    def test_audit_disabled_creates_no_database(self):
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.dict(os.environ, {'AUDIT_DISABLED': '1'}):
+            db_path = os.path.join(temp_dir, "audit_log.db")
+            logger = audit_logger.AuditLogger(db_path)
+            logger.log_error("API_CALL", "GOOGLE_ADS_API", "handle_exception", RuntimeError("quota exhausted"))
+            logger.log_operation("UPDATE", "AD", "update_ad_status")
+            logger.flush()
+
+            self.assertFalse(logger.enabled)
+            self.assertIsNone(logger._writer)
+            self.assertFalse(os.path.exists(db_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the SDK's in-memory query cache
+Run with: python -m unittest test_query_cache
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from google_ads_sdk.core import query_cache
+from google_ads_sdk.core.query_cache import QueryCache, cached_query, invalidates_query_cache
+
+
+class _FakeBaseClient:
+    """The part of BaseGoogleAdsClient that managers use for caching"""
+
+    def __init__(self):
+        self.query_cache = QueryCache(60.0)
+
+    def invalidate_query_cache(self):
+        self.query_cache.clear()
+
+
+class _KeywordLister:
+    QUERY_CACHE_TTL = 60.0
+
+    def __init__(self, base_client):
+        self.base_client = base_client
+        self._query_cache = base_client.query_cache
+        self.queries = 0
+
+    @cached_query
+    def list_keywords(self, ad_group_id=None):
+        self.queries += 1
+        return [{'text': "running shoes", 'ad_group_id': ad_group_id}]
+
+
+class _AdGroupWriter:
+
+    def __init__(self, base_client):
+        self.base_client = base_client
+
+    @invalidates_query_cache
+    def remove_ad_group(self, fail=False):
+        if fail:
+            raise RuntimeError("request failed after applying some operations")
+
+
+class QueryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(query_cache, 'time', SimpleNamespace(monotonic=lambda: self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entry_expires_after_ttl(self):
+        cache = QueryCache(ttl=60.0)
+        cache.put("key", [1])
+        self.now += 59.9
+        self.assertEqual(cache.get("key"), [1])
+        self.now += 0.1
+        self.assertIsNone(cache.get("key"))
+
+    def test_put_ttl_overrides_default(self):
+        cache = QueryCache(ttl=60.0)
+        cache.put("key", [1], ttl=5.0)
+        self.now += 5.0
+        self.assertIsNone(cache.get("key"))
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        cache = QueryCache(ttl=60.0, maxsize=2)
+        cache.put("first", [1])
+        cache.put("second", [2])
+        cache.put("third", [3])
+        self.assertIsNone(cache.get("first"))
+        self.assertEqual(cache.get("second"), [2])
+        self.assertEqual(cache.get("third"), [3])
+
+    def test_storing_again_moves_entry_to_the_back(self):
+        cache = QueryCache(ttl=60.0, maxsize=2)
+        cache.put("first", [1])
+        cache.put("second", [2])
+        cache.put("first", [1, 1])
+        cache.put("third", [3])
+        self.assertEqual(cache.get("first"), [1, 1])
+        self.assertIsNone(cache.get("second"))
+
+
+class CachedQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.base_client = _FakeBaseClient()
+        self.lister = _KeywordLister(self.base_client)
+
+    def test_repeated_call_is_served_from_cache(self):
+        self.lister.list_keywords("1")
+        self.lister.list_keywords("1")
+        self.lister.list_keywords(ad_group_id="1")
+        self.assertEqual(self.lister.queries, 2)
+
+    def test_use_cache_false_queries_again(self):
+        self.lister.list_keywords()
+        self.lister.list_keywords(use_cache=False)
+        self.assertEqual(self.lister.queries, 2)
+
+    def test_hits_get_their_own_copies(self):
+        self.lister.list_keywords()
+        hit = self.lister.list_keywords()
+        hit[0]['text'] = "changed"
+        hit.append({'text': "added"})
+        self.assertEqual(self.lister.list_keywords(), [{'text': "running shoes", 'ad_group_id': None}])
+
+    def test_write_through_another_manager_invalidates(self):
+        writer = _AdGroupWriter(self.base_client)
+        self.lister.list_keywords()
+        writer.remove_ad_group()
+        self.lister.list_keywords()
+        self.assertEqual(self.lister.queries, 2)
+
+    def test_failed_write_still_invalidates(self):
+        writer = _AdGroupWriter(self.base_client)
+        self.lister.list_keywords()
+        with self.assertRaises(RuntimeError):
+            writer.remove_ad_group(fail=True)
+        self.lister.list_keywords()
+        self.assertEqual(self.lister.queries, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()